@@ -1,87 +1,107 @@
 import sys
 import os
 
-# Add the src directory to the system path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+# Add the project root to the system path
+# Modules are imported as src.zzocker (like the tests do) so that both entry points
+# resolve to the same module names and share the on-disk Numba cache.
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 # Import necessary modules from the zzocker package
 try:
-    from zzocker import simulation
-    from zzocker import player_ai
-    from zzocker import state
+    from src.zzocker import simulation
+    from src.zzocker.ai import batch_ai
+    from src.zzocker import physics # Used directly by the batched rollouts
     # Optional imports if needed directly in the runner, otherwise used internally
-    # from zzocker import physics
-    # from zzocker import actions
+    # from src.zzocker import actions
 except ImportError as e:
     print(f"Error importing zzocker modules: {e}")
     print("Please ensure the 'src/zzocker' directory exists and contains the necessary files.")
     sys.exit(1)
 
 
-def run_game(num_steps=1000):
+def run_game(num_steps=1000, batch_size=None, use_gpu=False, verbose=False):
     """
     Sets up and runs a simulation of a zzocker game.
 
     Args:
         num_steps (int): The number of simulation steps to run.
+        batch_size (int, optional): If given, advance this many independent
+            physics rollouts together; each step is a single vectorized
+            physics update over all of them.
+        use_gpu (bool): Run the batched rollouts on the GPU (requires CuPy).
+        verbose (bool): Print a progress line every 100 steps.
     """
+    if batch_size is not None:
+        run_batched_rollouts(num_steps, batch_size, use_gpu=use_gpu, verbose=verbose)
+        return
+
     print("Setting up zzocker simulation...")
 
     try:
-        # Define initial game state (example)
-        # This assumes a basic GameState can be initialized or has a default
-        # You might need to adjust this based on the actual GameState constructor
-        initial_state = state.GameState() # Assuming GameState can be initialized like this
-
-        # Create AI instances for each team
-        # Assuming PlayerAI is the base class or a concrete AI implementation
-        team1_ai = player_ai.PlayerAI()
-        team2_ai = player_ai.PlayerAI()
-
-        # Map team IDs to AI instances
-        # Assuming initial_state.teams is a list of team objects with 'id' attribute
-        if not initial_state.teams or len(initial_state.teams) < 2:
-             print("Error: GameState did not initialize with at least two teams.")
-             sys.exit(1)
-
-        team_ais = {
-            initial_state.teams[0].id: team1_ai,
-            initial_state.teams[1].id: team2_ai,
-        }
-
-        # Create the simulation instance
-        sim = simulation.Simulation(initial_state, team_ais)
+        # Both teams at kick-off, home players first as SimulationManager expects
+        initial_state = simulation.kickoff_game_state()
 
-        print(f"Running simulation for {num_steps} steps...")
+        # One ball-seeking AI for both teams decides for all players in one call per step
+        team_ai = batch_ai.BallSeekerAI()
+        sim = simulation.SimulationManager(team_ai, team_ai, game_state=initial_state)
 
-        # Run the simulation for the specified number of steps
+        print(f"Running simulation for {num_steps} steps...")
+        sim.start()
         for step in range(num_steps):
-            # The simulation.step() method should internally call the AIs
-            # to get actions and update the state based on physics.
-            sim.step()
-
-            # Optional: Print state or progress indicator
-            if step % 100 == 0:
-                print(f"Step {step}/{num_steps} complete.")
-                # Example state info (uncomment if state attributes are accessible)
-                # try:
-                #     print(f"Ball position: {sim.current_state.ball.position}")
-                # except AttributeError:
-                #     pass # Ignore if state structure is different
-
-        print("Simulation finished.")
-        # Optional: Print final score or state summary
-        # try:
-        #     print(f"Final Score: Team {initial_state.teams[0].id}: {sim.current_state.teams[0].score}, Team {initial_state.teams[1].id}: {sim.current_state.teams[1].score}")
-        # except AttributeError:
-        #     pass # Ignore if state structure is different
+            # step() calls the AIs, applies their actions, advances the physics
+            # and handles the game events; it returns False once the game is over
+            if not sim.step():
+                break
+
+            if verbose and step % 100 == 0:
+                print(f"Step {step}/{num_steps} complete. Ball position: {initial_state.ball.position.tolist()}")
+
+        home, away = initial_state.score
+        print(f"Simulation finished after {initial_state.game_time:.1f} s of game time. "
+              f"Final score: home {home} - away {away}")
 
     except Exception as e:
         print(f"An error occurred during simulation setup or execution: {e}")
         sys.exit(1)
 
 
+def run_batched_rollouts(num_steps, batch_size, dt=1/60.0, use_gpu=False, verbose=False):
+    """
+    Runs `batch_size` independent physics rollouts side by side.
+
+    The games live on the leading axis of a batched physics.State, so the step
+    loop makes one physics call per step regardless of the number of games.
+    Callers that need per-game termination can pass a done mask to
+    `batch_state.reset(done)` to restart only the finished games in place.
+
+    With `use_gpu` the arrays stay on the device for the whole run and are
+    only copied back to the host on logging steps (every 100 steps with `verbose`).
+
+    Returns:
+        The batched physics.State after the last step.
+    """
+    print(f"Running {batch_size} batched rollouts for {num_steps} steps...")
+    if use_gpu and physics.cupy is None:
+        print("CuPy is not installed; running the batched rollouts on the CPU.")
+        use_gpu = False
+    xp = physics.cupy if use_gpu else None
+    physics.warmup(xp) # Keep kernel compilation/startup out of the step loop
+    batch_state = physics.State(batch_size=batch_size, xp=xp)
+
+    for step in range(num_steps):
+        physics.update_physics(batch_state, dt)
+
+        if verbose and step % 100 == 0:
+            ball_x = batch_state.pos[:, 0, 0]
+            if use_gpu:
+                ball_x = ball_x.get()
+            print(f"Step {step}/{num_steps} complete. Mean ball x: {ball_x.mean():.1f}")
+
+    print("Batched rollouts finished.")
+    return batch_state
+
+
 if __name__ == '__main__':
     # You can modify the number of steps here or add command line argument parsing
     default_steps = 5000
-    run_game(num_steps=default_steps)
\ No newline at end of file
+    run_game(num_steps=default_steps, verbose=True)
\ No newline at end of file
@@ -1,14 +1,114 @@
 import abc
+import logging
 from typing import Tuple, Optional, Dict, Any
 
+import numpy as np
+
 # Forward references for type hinting classes defined elsewhere
 # (e.g., in game_state.py, player.py)
 GameState = 'GameState'
 Player = 'Player'
 
+logger = logging.getLogger(__name__)
+
+# Possible outcomes of the stochastic actions (drawn uniformly)
+SHOT_OUTCOMES = ("goal", "save", "miss")
+TACKLE_OUTCOMES = ("success", "failure", "foul")
+# Outcome name -> EventLog outcome_code (its index in SHOT_OUTCOMES/TACKLE_OUTCOMES)
+OUTCOME_CODES = {outcome: code for outcomes in (SHOT_OUTCOMES, TACKLE_OUTCOMES)
+                 for code, outcome in enumerate(outcomes)}
+
+class OutcomeSampler:
+    """
+    Draws action outcomes from a NumPy Generator.
+
+    Single draws are served from a block of uniforms generated in bulk, so an
+    action only pays for an array read instead of a Python-level RNG call.
+    """
+    __slots__ = ('rng', 'block_size', '_uniforms', '_next')
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 4096):
+        self.rng = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._uniforms = []
+        self._next = 0
+
+    def choice(self, outcomes: Tuple[str, ...]) -> str:
+        """Returns one of `outcomes`, chosen uniformly."""
+        if self._next == len(self._uniforms):
+            self._uniforms = self.rng.random(self.block_size).tolist()
+            self._next = 0
+        u = self._uniforms[self._next]
+        self._next += 1
+        return outcomes[int(u * len(outcomes))]
+
+    def choices(self, outcomes: Tuple[str, ...], size: int) -> np.ndarray:
+        """Returns `size` outcomes at once (e.g. one shot per game of a batch)."""
+        return np.asarray(outcomes)[self.rng.integers(0, len(outcomes), size=size)]
+
+# Shared by all actions; reseed with seed_outcomes() for reproducible games
+_sampler = OutcomeSampler()
+
+def seed_outcomes(seed: Optional[int]) -> None:
+    """Resets the outcome sampler used by ShootAction and TackleAction."""
+    global _sampler
+    _sampler = OutcomeSampler(seed)
+
+def resolve_shots(size: int) -> np.ndarray:
+    """Draws the outcome of `size` shots with a single RNG call."""
+    return _sampler.choices(SHOT_OUTCOMES, size)
+
+def resolve_tackles(size: int) -> np.ndarray:
+    """Draws the outcome of `size` tackles with a single RNG call."""
+    return _sampler.choices(TACKLE_OUTCOMES, size)
+
+# Integer codes for EventLog.action_type (index into ACTION_TYPES)
+ACTION_TYPES = ("move", "pass", "shoot", "tackle")
+EVENT_DTYPE = np.dtype([
+    ("step", np.int32),
+    ("actor_id", np.int32),
+    ("action_type", np.int8),
+    ("outcome_code", np.int8), # Index into SHOT_OUTCOMES/TACKLE_OUTCOMES, 0 for deterministic actions
+])
+
+class EventLog:
+    """
+    Append-only log of action outcomes stored as one NumPy record array.
+
+    Recording an event writes four integers into a preallocated buffer instead
+    of keeping the ActionResult and its data dict alive.
+    """
+    __slots__ = ('_events', '_size')
+
+    def __init__(self, capacity: int = 1024):
+        self._events = np.zeros(capacity, dtype=EVENT_DTYPE)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def record(self, step: int, actor_id: int, action_type: int, outcome_code: int = 0) -> None:
+        """Appends one event, doubling the buffer when it is full."""
+        if self._size == len(self._events):
+            self._events = np.resize(self._events, 2 * len(self._events))
+        self._events[self._size] = (step, actor_id, action_type, outcome_code)
+        self._size += 1
+
+    @property
+    def events(self) -> np.ndarray:
+        """The recorded events (a view, valid until the next record())."""
+        return self._events[:self._size]
+
+    def clear(self) -> None:
+        """Drops all events, keeping the buffer for reuse."""
+        self._size = 0
+
 class ActionResult:
     """Represents the outcome of performing an action."""
-    def __init__(self, success: bool, message: str = "", data: Dict[str, Any] | None = None):
+    __slots__ = ('success', '_message', '_message_args', 'data')
+
+    def __init__(self, success: bool, message: str = "", data: Dict[str, Any] | None = None,
+                 message_args: Tuple[Any, ...] | None = None):
         """
         Initializes an ActionResult.
 
@@ -17,16 +117,27 @@ class ActionResult:
             message: A descriptive message about the action's outcome.
             data: A dictionary containing relevant data about the outcome
                   (e.g., who passed, who received, tackle success, new position).
+            message_args: If given, `message` is a %-style template that is only
+                  formatted with these arguments when the message is read.
         """
         self.success: bool = success
-        self.message: str = message
+        self._message: str = message
+        self._message_args = message_args
         self.data: Dict[str, Any] = data if data is not None else {}
 
+    @property
+    def message(self) -> str:
+        if self._message_args is not None:
+            self._message = self._message % self._message_args
+            self._message_args = None
+        return self._message
+
     def __repr__(self) -> str:
         return f"ActionResult(success={self.success}, message='{self.message}', data={self.data})"
 
 class Action(abc.ABC):
     """Abstract base class for all player actions."""
+    __slots__ = ()
 
     @abc.abstractmethod
     def apply(self, game_state: GameState, player: Player) -> ActionResult:
@@ -48,6 +159,8 @@ class Action(abc.ABC):
 
 class MoveAction(Action):
     """Represents a player moving to a new position."""
+    __slots__ = ('target_position',)
+
     def __init__(self, target_position: Tuple[int, int]):
         self.target_position: Tuple[int, int] = target_position
 
@@ -62,14 +175,14 @@ class MoveAction(Action):
         # In a real implementation, game_state would handle validity checks,
         # updating player position, potential collisions, etc.
         # For now, simulate a successful move and return data.
-        print(f"Player {player.id} attempting to move to {self.target_position}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player %s attempting to move to %s", player.id, self.target_position)
 
         # Example of updating state (would typically call a GameState method)
         # success = game_state.try_move_player(player.id, self.target_position)
 
         # Simulate outcome
         success = True # Assume move is always successful in this simulation
-        message = f"Player {player.id} moved to {self.target_position}"
         data = {
             "player_id": player.id,
             "old_position": player.position, # Need access to player's old position
@@ -85,10 +198,13 @@ class MoveAction(Action):
         #     message = f"Player {player.id} failed to move to {self.target_position}"
         #     data["new_position"] = player.position # Position remains unchanged
 
-        return ActionResult(success=success, message=message, data=data)
+        return ActionResult(success=success, message="Player %s moved to %s", data=data,
+                            message_args=(player.id, self.target_position))
 
 class PassAction(Action):
     """Represents a player passing the ball."""
+    __slots__ = ('target_player_id', 'target_position')
+
     def __init__(self, target_player_id: Optional[int] = None, target_position: Optional[Tuple[int, int]] = None):
         if target_player_id is None and target_position is None:
             raise ValueError("PassAction requires either target_player_id or target_position")
@@ -106,7 +222,8 @@ class PassAction(Action):
         Applies the pass action.
         (Placeholder implementation - actual logic would be in GameState)
         """
-        print(f"Player {player.id} attempting to pass...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player %s attempting to pass...", player.id)
 
         # In a real implementation, game_state would handle:
         # - Checking if player has the ball
@@ -122,16 +239,16 @@ class PassAction(Action):
             "from_player_id": player.id,
             "outcome": "simulated_completion" # or "simulated_incomplete", "simulated_interception"
         }
-        message = f"Pass from player {player.id}."
-
         if self.target_player_id is not None:
-            message += f" towards player {self.target_player_id}."
+            message = "Pass from player %s. towards player %s."
+            message_args = (player.id, self.target_player_id)
             outcome_data["target_player_id"] = self.target_player_id
             # Simulate passing the ball to the target player if successful
             # if success: game_state.transfer_ball(player.id, self.target_player_id)
 
         elif self.target_position is not None:
-            message += f" towards position {self.target_position}."
+            message = "Pass from player %s. towards position %s."
+            message_args = (player.id, self.target_position)
             outcome_data["target_position"] = self.target_position
             # Simulate placing the ball at the target position if successful
             # if success: game_state.place_ball(self.target_position)
@@ -139,10 +256,13 @@ class PassAction(Action):
         # Add more detailed outcome simulation if needed (e.g., who intercepted)
         # outcome_data["intercepted_by"] = None # if applicable
 
-        return ActionResult(success=success, message=message, data=outcome_data)
+        return ActionResult(success=success, message=message, data=outcome_data,
+                            message_args=message_args)
 
 class ShootAction(Action):
     """Represents a player shooting the ball towards a goal."""
+    __slots__ = ('target_goal_id', 'target_position')
+
     def __init__(self, target_goal_id: Optional[int] = None, target_position: Optional[Tuple[int, int]] = None):
          if target_goal_id is None and target_position is None:
             raise ValueError("ShootAction requires either target_goal_id or target_position")
@@ -160,7 +280,8 @@ class ShootAction(Action):
         Applies the shoot action.
         (Placeholder implementation - actual logic would be in GameState)
         """
-        print(f"Player {player.id} attempting to shoot...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player %s attempting to shoot...", player.id)
 
         # In a real implementation, game_state would handle:
         # - Checking if player has the ball
@@ -170,9 +291,7 @@ class ShootAction(Action):
         # - Updating score if goal
 
         # Simulate outcome
-        import random
-        possible_outcomes = ["goal", "save", "miss"]
-        simulated_outcome = random.choice(possible_outcomes)
+        simulated_outcome = _sampler.choice(SHOT_OUTCOMES)
         success = simulated_outcome == "goal" # Primary success is scoring a goal
 
         outcome_data = {
@@ -180,23 +299,26 @@ class ShootAction(Action):
             "shooter_id": player.id,
             "outcome": simulated_outcome
         }
-        message = f"Shot by player {player.id}. Outcome: {simulated_outcome}."
-
         if self.target_goal_id is not None:
              outcome_data["target_goal_id"] = self.target_goal_id
-             message = f"Shot by {player.id} towards goal {self.target_goal_id}. Outcome: {simulated_outcome}."
+             message = "Shot by %s towards goal %s. Outcome: %s."
+             message_args = (player.id, self.target_goal_id, simulated_outcome)
         elif self.target_position is not None:
              outcome_data["target_position"] = self.target_position
-             message = f"Shot by {player.id} towards position {self.target_position}. Outcome: {simulated_outcome}."
+             message = "Shot by %s towards position %s. Outcome: %s."
+             message_args = (player.id, self.target_position, simulated_outcome)
 
         # If outcome was "goal", game_state would update the score
         # if simulated_outcome == "goal":
         #     game_state.score_goal(player.team_id) # Assuming player has team_id
 
-        return ActionResult(success=success, message=message, data=outcome_data)
+        return ActionResult(success=success, message=message, data=outcome_data,
+                            message_args=message_args)
 
 class TackleAction(Action):
     """Represents a player attempting to tackle an opponent."""
+    __slots__ = ('target_player_id',)
+
     def __init__(self, target_player_id: int):
         self.target_player_id: int = target_player_id
 
@@ -208,7 +330,8 @@ class TackleAction(Action):
         Applies the tackle action.
         (Placeholder implementation - actual logic would be in GameState)
         """
-        print(f"Player {player.id} attempting to tackle player {self.target_player_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Player %s attempting to tackle player %s", player.id, self.target_player_id)
 
         # In a real implementation, game_state would handle:
         # - Checking if target is an opponent and is near
@@ -217,9 +340,7 @@ class TackleAction(Action):
         # - Handling fouls, injuries on failure/specific outcomes
 
         # Simulate outcome
-        import random
-        possible_outcomes = ["success", "failure", "foul"]
-        simulated_outcome = random.choice(possible_outcomes)
+        simulated_outcome = _sampler.choice(TACKLE_OUTCOMES)
         success = simulated_outcome == "success" # Primary success is winning the ball
 
         outcome_data = {
@@ -228,7 +349,6 @@ class TackleAction(Action):
             "tackled_id": self.target_player_id,
             "outcome": simulated_outcome
         }
-        message = f"Tackle attempt by {player.id} on {self.target_player_id}. Outcome: {simulated_outcome}."
 
         # If outcome was "success", game_state would transfer ball possession
         # if simulated_outcome == "success":
@@ -237,7 +357,106 @@ class TackleAction(Action):
         # elif simulated_outcome == "foul":
         #    game_state.handle_foul(...)
 
-        return ActionResult(success=success, message=message, data=outcome_data)
+        return ActionResult(success=success, message="Tackle attempt by %s on %s. Outcome: %s.",
+                            data=outcome_data,
+                            message_args=(player.id, self.target_player_id, simulated_outcome))
+
+# Kind codes for ActionBatch (index into ACTION_TYPES; NO_ACTION for idle players)
+NO_ACTION = -1
+MOVE, PASS, SHOOT, TACKLE = range(len(ACTION_TYPES))
+
+class ActionBatch:
+    """
+    One step of actions for every player, stored as arrays instead of Action objects.
+
+    Row `i` (or `[game, i]` with batch_size set) holds the action of player `i`.
+    Fields that do not apply to an action kind are left untouched.
+
+    Attributes:
+        kinds: (N,) int8 action kind codes (MOVE, PASS, ...), or (B, N).
+        target_xy: (N, 2) int32 target positions, or (B, N, 2).
+        target_id: (N,) int32 target player/goal ids, -1 when not set, or (B, N).
+    """
+    __slots__ = ('kinds', 'target_xy', 'target_id')
+
+    def __init__(self, num_players: int, batch_size: Optional[int] = None):
+        shape = (num_players,) if batch_size is None else (batch_size, num_players)
+        self.kinds = np.full(shape, NO_ACTION, dtype=np.int8)
+        self.target_xy = np.zeros(shape + (2,), dtype=np.int32)
+        self.target_id = np.full(shape, -1, dtype=np.int32)
+
+    def lanes(self, start: int, stop: int) -> 'ActionBatch':
+        """
+        Returns an ActionBatch over players [start, stop) that shares this one's arrays.
+
+        Writing into the returned batch (e.g. one team's players) fills the
+        corresponding rows of this batch; nothing is copied.
+        """
+        view = ActionBatch.__new__(ActionBatch)
+        view.kinds = self.kinds[..., start:stop]
+        view.target_xy = self.target_xy[..., start:stop, :]
+        view.target_id = self.target_id[..., start:stop]
+        return view
+
+    def clear(self) -> None:
+        """Marks every player as idle, ready for the next step."""
+        self.kinds.fill(NO_ACTION)
+        self.target_id.fill(-1)
+
+    def get(self, index) -> Optional[Action]:
+        """Builds the Action object stored in slot `index` (None for idle players)."""
+        kind = self.kinds[index]
+        if kind == NO_ACTION:
+            return None
+        target_id = int(self.target_id[index])
+        target_xy = tuple(self.target_xy[index].tolist())
+        if kind == MOVE:
+            return MoveAction(target_xy)
+        if kind == TACKLE:
+            return TackleAction(target_id)
+        action_type = PassAction if kind == PASS else ShootAction
+        if target_id != -1:
+            return action_type(target_id)
+        return action_type(target_position=target_xy)
+
+    def set(self, index, action: Action) -> None:
+        """
+        Writes an Action object into slot `index`, for AIs that still return objects.
+
+        Args:
+            index: Player index, or a (game, player) tuple for batched buffers.
+            action: One of MoveAction, PassAction, ShootAction or TackleAction.
+        """
+        if isinstance(action, MoveAction):
+            self.kinds[index] = MOVE
+            self.target_xy[index] = action.target_position
+            return
+        if isinstance(action, PassAction):
+            self.kinds[index] = PASS
+            target_id = action.target_player_id
+        elif isinstance(action, ShootAction):
+            self.kinds[index] = SHOOT
+            target_id = action.target_goal_id
+        elif isinstance(action, TackleAction):
+            self.kinds[index] = TACKLE
+            self.target_id[index] = action.target_player_id
+            return
+        else:
+            raise TypeError(f"Unsupported action type: {type(action).__name__}")
+        if target_id is not None:
+            self.target_id[index] = target_id
+        else:
+            self.target_xy[index] = action.target_position
+
+def apply_moves(pos: np.ndarray, batch: ActionBatch) -> None:
+    """
+    Applies every MOVE in `batch` at once by moving those players to their targets.
+
+    Args:
+        pos: Player positions with the same leading shape as the batch, e.g. (N, 2).
+        batch: The actions for this step.
+    """
+    np.copyto(pos, batch.target_xy, where=(batch.kinds == MOVE)[..., None], casting='unsafe')
 
 # Example of how an action might be created and applied (for illustration, not part of the file content)
 # from .game_state import GameState # Assuming GameState is in .game_state
@@ -0,0 +1,90 @@
+"""
+Team AI that decides for all of its players in one vectorized pass.
+
+Instead of one AIBasePlayer call per player per tick, the decision formula
+(direction to the ball, distance, shoot threshold) is evaluated with NumPy
+over every player at once and written straight into an actions.ActionBatch.
+"""
+import numpy as np
+
+from .. import actions
+
+# Distance (field units) a player advances towards the ball per tick
+SEEK_STEP = 2.0
+# Gap between the player's and the ball's edges within which the player shoots
+KICK_REACH = 5.0
+
+
+def compute_all_actions(pos, ball_pos, radii, ball_radius, reach=KICK_REACH):
+    """
+    Seek-the-ball decisions for every player at once.
+
+    Args:
+        pos: (N, 2) player positions.
+        ball_pos: (2,) ball position.
+        radii: (N,) player radii.
+        ball_radius: Radius of the ball.
+        reach: KICK_REACH override.
+
+    Returns:
+        (move_dirs, kick) tuple: (N, 2) float32 unit vectors from each player
+        towards the ball (zero for a player already on it), and an (N,) bool
+        mask of the players close enough to kick.
+    """
+    delta = np.asarray(ball_pos, dtype=np.float32) - np.asarray(pos, dtype=np.float32)
+    dist = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+    move_dirs = np.divide(delta, dist[:, None], out=np.zeros_like(delta), where=dist[:, None] > 0)
+    kick = dist < np.asarray(radii, dtype=np.float32) + (ball_radius + reach)
+    return move_dirs, kick
+
+
+class BallSeekerAI:
+    """
+    Every player runs at the ball and shoots at the opposing goal once in reach.
+
+    Implements both the per-team get_actions contract of SimulationManager and
+    get_actions_batched, so one instance passed for both teams decides for
+    all players in a single call per tick.
+    """
+    __slots__ = ('step',)
+
+    def __init__(self, step: float = SEEK_STEP):
+        """
+        Args:
+            step: Distance a player advances towards the ball per tick.
+        """
+        self.step = step
+
+    def get_actions(self, game_state, team_id, out):
+        """
+        Writes the actions of one team into its lanes `out`.
+
+        Team 1 owns the first len(out) players of game_state and team 2 the
+        last, matching SimulationManager's lane split.
+
+        Args:
+            game_state: A state.GameState, or a state.StateSnapshot of one.
+            team_id: 1 or 2.
+            out: The team's lanes of the step's actions.ActionBatch.
+        """
+        n = len(out.kinds)
+        team = slice(0, n) if team_id == 1 else slice(len(game_state.positions) - n, None)
+        goal_ids = np.full(n, 2 if team_id == 1 else 1, dtype=np.int32)
+        self._write_actions(game_state, team, goal_ids, out)
+
+    def get_actions_batched(self, game_state, out):
+        """Writes the actions of both teams into the full ActionBatch `out`."""
+        n = len(game_state.positions)
+        goal_ids = np.where(np.arange(n) < n // 2, 2, 1).astype(np.int32)
+        self._write_actions(game_state, slice(None), goal_ids, out)
+
+    def _write_actions(self, game_state, rows, goal_ids, out):
+        """Decides for the players in `rows` (a slice) and fills the matching lanes of `out`."""
+        pos = game_state.positions[rows, :2]
+        move_dirs, kick = compute_all_actions(pos, game_state.ball_position[:2], game_state.radii[rows],
+                                              game_state.ball_radius)
+
+        out.kinds[:] = np.where(kick, actions.SHOOT, actions.MOVE)
+        targets = np.rint(pos + move_dirs * self.step)
+        np.copyto(out.target_xy, targets, casting='unsafe')
+        out.target_id[:] = np.where(kick, goal_ids, -1)
@@ -20,13 +20,18 @@ class _PlaceholderAction:
 #     'DO_NOTHING': _PlaceholderAction('DO_NOTHING'),
 # })
 
+# Grid size (field units) used to bucket positions in the decision cache key
+DECISION_BUCKET_SIZE = 8
+
 
 class AIBasePlayer(abc.ABC):
     """
     Base class for all AI players.
 
     AI players should inherit from this class and implement the
-    decide_action method.
+    decide_action method. Callers should go through get_action, which reuses
+    the previous decision while the player's surroundings are unchanged;
+    PlayerAITeam does so for a whole team in the simulation.
     """
 
     def __init__(self, player_id):
@@ -37,6 +42,39 @@ class AIBasePlayer(abc.ABC):
             player_id: The unique identifier for this player.
         """
         self.player_id = player_id
+        self._last_key = None
+        self._last_action = None
+
+    def decision_key(self, game_state):
+        """
+        Returns a cheap summary of the state this player's decision depends on.
+
+        The default buckets the player and ball positions into a
+        DECISION_BUCKET_SIZE grid and adds whether the player has the ball.
+        Subclasses that react to other parts of the state should override
+        this, or return None to disable caching.
+        """
+        player = game_state.get_player_by_id(self.player_id)
+        if player is None:
+            return None
+        px, py = player.position[0], player.position[1]
+        bx, by = game_state.ball.position[0], game_state.ball.position[1]
+        return (
+            int(px // DECISION_BUCKET_SIZE), int(py // DECISION_BUCKET_SIZE),
+            int(bx // DECISION_BUCKET_SIZE), int(by // DECISION_BUCKET_SIZE),
+            game_state.ball_possession_player_id == self.player_id,
+        )
+
+    def get_action(self, game_state):
+        """
+        Returns the action for this tick, calling decide_action only when the
+        decision key changed since the last call.
+        """
+        key = self.decision_key(game_state)
+        if key is None or key != self._last_key:
+            self._last_action = self.decide_action(game_state)
+            self._last_key = key
+        return self._last_action
 
     @abc.abstractmethod
     def decide_action(self, game_state):
@@ -60,75 +98,30 @@ class AIBasePlayer(abc.ABC):
     def __repr__(self):
         return f"<{self.__class__.__name__}(id={self.player_id})>"
 
-# Example of how a concrete AI player might inherit
-# class SimpleAIPlayer(AIBasePlayer):
-#     def decide_action(self, game_state):
-#         # Example simple logic: always move right
-#         # In a real scenario, game_state would be used to make decisions
-#         # return actions.MOVE_RIGHT
-#         pass # Replace with actual action return
-```python
-import abc
-# Assuming actions are defined in a module named 'actions'
-# from .. import actions # Or wherever actions are defined relative to this file
-
-# Define a placeholder for actions if the actual module isn't available
-# In a real project, you would import the actual actions module
-class _PlaceholderAction:
-    def __init__(self, name):
-        self.name = name
-    def __repr__(self):
-        return f"<_PlaceholderAction: {self.name}>"
-
-# Example placeholder actions (replace with actual import)
-# actions = type('actions', (object,), {
-#     'MOVE_UP': _PlaceholderAction('MOVE_UP'),
-#     'MOVE_DOWN': _PlaceholderAction('MOVE_DOWN'),
-#     'MOVE_LEFT': _PlaceholderAction('MOVE_LEFT'),
-#     'MOVE_RIGHT': _PlaceholderAction('MOVE_RIGHT'),
-#     'ATTACK': _PlaceholderAction('ATTACK'),
-#     'DO_NOTHING': _PlaceholderAction('DO_NOTHING'),
-# })
-
 
-class AIBasePlayer(abc.ABC):
+class PlayerAITeam:
     """
-    Base class for all AI players.
+    Team AI for SimulationManager made of one AIBasePlayer per player.
 
-    AI players should inherit from this class and implement the
-    decide_action method.
+    Each step it asks every player's AI through get_action (so unchanged
+    surroundings reuse the cached decision) and writes the Action objects
+    into the team's lanes; a None decision leaves the player idle.
     """
+    __slots__ = ('player_ais',)
 
-    def __init__(self, player_id):
+    def __init__(self, player_ais):
         """
-        Initializes the AI player.
-
         Args:
-            player_id: The unique identifier for this player.
-        """
-        self.player_id = player_id
-
-    @abc.abstractmethod
-    def decide_action(self, game_state):
+            player_ais: The AIBasePlayer of each player, in the team's lane order.
         """
-        Decides the next action for the player based on the current game state.
+        self.player_ais = list(player_ais)
 
-        This method must be implemented by subclasses.
-
-        Args:
-            game_state: An object representing the current state of the game.
-                        The structure of game_state should be defined elsewhere.
-
-        Returns:
-            An action object (e.g., from an 'actions' module) representing
-            the player's chosen action.
-        """
-        # This method should be implemented by subclasses.
-        # Example: return actions.DO_NOTHING
-        raise NotImplementedError("Subclasses must implement decide_action method")
-
-    def __repr__(self):
-        return f"<{self.__class__.__name__}(id={self.player_id})>"
+    def get_actions(self, game_state, team_id, out):
+        """Writes the decision of each player AI into its lane of `out`."""
+        for lane, ai in enumerate(self.player_ais):
+            action = ai.get_action(game_state)
+            if action is not None:
+                out.set(lane, action)
 
 # Example of how a concrete AI player might inherit
 # class SimpleAIPlayer(AIBasePlayer):
@@ -136,4 +129,4 @@ class AIBasePlayer(abc.ABC):
 #         # Example simple logic: always move right
 #         # In a real scenario, game_state would be used to make decisions
 #         # return actions.MOVE_RIGHT
-#         pass # Replace with actual action return
\ No newline at end of file
+#         pass # Replace with actual action return
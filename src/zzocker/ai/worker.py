@@ -0,0 +1,74 @@
+"""
+Runs a team AI on a background thread, decoupled from the simulation tick.
+"""
+import threading
+
+import numpy as np
+
+from .. import actions
+
+
+class AIWorker:
+    """
+    Wraps a team AI so that its planning never stalls the simulation step.
+
+    Drop-in for the wrapped AI in SimulationManager: get_actions hands a
+    GameState.snapshot() to the worker thread and immediately writes the most
+    recent finished plan into `out`, without waiting for a new one. Players
+    stay idle until the first plan is ready, and plans may be a few ticks old.
+
+    The wrapped AI therefore plans on a state.StateSnapshot, never on the
+    game state the simulation keeps advancing; it must only read what the
+    snapshot has (e.g. ai.batch_ai.BallSeekerAI). The compiled physics
+    kernels release the GIL, so planning and physics can overlap.
+    """
+    __slots__ = ('_ai', '_cv', '_requests', '_plans', '_closed', '_thread')
+
+    def __init__(self, ai):
+        """
+        Args:
+            ai: The team AI to run, with get_actions(game_state, team_id, out).
+        """
+        self._ai = ai
+        self._cv = threading.Condition()
+        # Kept per team, so one worker can play both teams of a game
+        self._requests = {} # team_id -> latest (snapshot, n_lanes) not yet planned for
+        self._plans = {} # team_id -> latest finished actions.ActionBatch
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"AIWorker({ai!r})", daemon=True)
+        self._thread.start()
+
+    def get_actions(self, game_state, team_id, out):
+        """Requests a new plan for `team_id` and writes its latest finished one into `out`."""
+        snapshot = game_state.snapshot()
+        with self._cv:
+            self._requests[team_id] = (snapshot, len(out.kinds))
+            plan = self._plans.get(team_id)
+            self._cv.notify()
+        if plan is not None and plan.kinds.shape == out.kinds.shape:
+            np.copyto(out.kinds, plan.kinds)
+            np.copyto(out.target_xy, plan.target_xy)
+            np.copyto(out.target_id, plan.target_id)
+
+    def stop(self):
+        """Stops the worker thread once its current plan is finished."""
+        with self._cv:
+            self._closed = True
+            self._cv.notify()
+        self._thread.join()
+
+    def _run(self):
+        """Worker loop: plans for each team's newest request, dropping older ones."""
+        while True:
+            with self._cv:
+                while not self._requests and not self._closed:
+                    self._cv.wait()
+                if self._closed:
+                    return
+                # The team that has waited longest goes first
+                team_id = next(iter(self._requests))
+                snapshot, n_lanes = self._requests.pop(team_id)
+            plan = actions.ActionBatch(n_lanes)
+            self._ai.get_actions(snapshot, team_id, plan)
+            with self._cv:
+                self._plans[team_id] = plan
@@ -1,105 +1,557 @@
+import array
 import math
-# Assume entity and state definitions exist and are importable
-# from .state import State, Entity # Example import structure
+from enum import IntEnum
+
+import numpy as np
+
+try:
+    import numba
+    from numba import prange
+except ImportError: # Numba is optional; update_physics falls back to the NumPy path
+    numba = None
+    prange = range
+
+try:
+    import cupy
+except ImportError: # CuPy is optional; only needed for State(xp=cupy)
+    cupy = None
+
+# Physics entities, and the SoA State the ball and players are advanced in
+class EntityType(IntEnum):
+    """Integer entity tags, also used as indices into _DAMPING_LUT."""
+    BALL = 0
+    PLAYER = 1
 
-# Define simple Entity and State classes for demonstration if not imported
-# In a real scenario, these would be defined elsewhere (e.g., src/zzocker/state.py)
 class Entity:
+    __slots__ = ('entity_type', 'type_idx', 'position', 'velocity', 'radius', 'damping_factor')
+
     def __init__(self, entity_type, position, velocity, radius=0):
         self.entity_type = entity_type # e.g., 'ball', 'player'
-        self.position = list(position) # Use list for mutability
-        self.velocity = list(velocity) # Use list for mutability
+        self.type_idx = EntityType[entity_type.upper()]
+        # Unboxed float32 buffers (same precision as State), still mutable in place
+        self.position = array.array('f', position)
+        self.velocity = array.array('f', velocity)
         self.radius = radius
         self.damping_factor = 0.95 # Default damping
 
-class State:
-    def __init__(self):
-        self.entities = []
-        # Example initialization (replace with actual game setup)
-        self.entities.append(Entity('ball', (400, 300), (50, -30), radius=10))
-        self.entities.append(Entity('player', (100, 300), (0, 0), radius=15))
-        self.entities.append(Entity('player', (700, 300), (0, 0), radius=15))
-
 
 # --- Constants ---
 # Field boundaries (min_x, max_x, min_y, max_y)
 FIELD_BOUNDARIES = (0, 800, 0, 600) # Example dimensions
+MIN_X, MAX_X, MIN_Y, MAX_Y = FIELD_BOUNDARIES
+# Per-axis lower/upper bounds, broadcast against (N, 2) positions
+_FIELD_LO = np.array((MIN_X, MIN_Y), dtype=np.float32)
+_FIELD_HI = np.array((MAX_X, MAX_Y), dtype=np.float32)
 
 # Damping factors (reduces velocity over time)
 BALL_DAMPING = 0.99
 PLAYER_DAMPING = 0.97 # Players might have less friction or self-propulsion
+# Damping per EntityType, so selecting it is a gather instead of a string compare
+_DAMPING_LUT = np.array([BALL_DAMPING, PLAYER_DAMPING], dtype=np.float32)
+
+
+class State:
+    """
+    Physics state stored as a structure of arrays (one row per entity).
+
+    With `batch_size` set, every array gains a leading batch axis so that one
+    `update_physics` call advances that many independent games at once.
+
+    Attributes:
+        pos: (N, 2) float32 positions, or (B, N, 2) when batched.
+        vel: (N, 2) float32 velocities, or (B, N, 2) when batched.
+        radius: (N,) float32 collision radii, or (B, N) when batched.
+        damping: (N,) float32 per-entity damping factor applied every update, or (B, N).
+        is_ball: (N,) bool mask of entities that bounce off the field boundaries, or (B, N).
+        type_idx: (N,) int8 EntityType of each entity, or (B, N).
+        ball_rows: Indices of the ball entities in the flattened (B*N) entity
+                   axis, so the boundary pass can skip the players entirely.
+        xp: Array module the arrays live in (`numpy`, or `cupy` to keep them on the GPU).
+    """
+    __slots__ = ('batch_size', 'entity_types', 'pos', 'vel', 'radius', 'damping', 'is_ball',
+                 'type_idx', 'ball_rows', 'xp', '_initial_pos', '_initial_vel')
+
+    def __init__(self, entities=None, batch_size=None, xp=None):
+        if entities is None:
+            # Example initialization (replace with actual game setup)
+            entities = [
+                Entity('ball', (400, 300), (50, -30), radius=10),
+                Entity('player', (100, 300), (0, 0), radius=15),
+                Entity('player', (700, 300), (0, 0), radius=15),
+            ]
+        n = len(entities)
+        shape = (n,) if batch_size is None else (batch_size, n)
+        self.batch_size = batch_size
+        self.entity_types = [entity.entity_type for entity in entities]
+        self.pos = np.zeros(shape + (2,), dtype=np.float32)
+        self.vel = np.zeros(shape + (2,), dtype=np.float32)
+        self.radius = np.zeros(shape, dtype=np.float32)
+        self.type_idx = np.zeros(shape, dtype=np.int8)
+        for i, entity in enumerate(entities):
+            self.pos[..., i, :] = entity.position
+            self.vel[..., i, :] = entity.velocity
+            self.radius[..., i] = entity.radius
+            self.type_idx[..., i] = entity.type_idx
+        self.damping = _DAMPING_LUT[self.type_idx]
+        self.is_ball = self.type_idx == EntityType.BALL
+        self.ball_rows = np.flatnonzero(self.is_ball)
+        self.xp = np if xp is None else xp
+        if self.xp is not np:
+            # Built on the host, then copied to the device once
+            self.pos = self.xp.asarray(self.pos)
+            self.vel = self.xp.asarray(self.vel)
+            self.radius = self.xp.asarray(self.radius)
+            self.damping = self.xp.asarray(self.damping)
+            self.is_ball = self.xp.asarray(self.is_ball)
+            self.type_idx = self.xp.asarray(self.type_idx)
+        # Kept for reset()
+        self._initial_pos = self.pos.copy()
+        self._initial_vel = self.vel.copy()
+
+    def reset(self, done=None):
+        """
+        Restores the initial positions and velocities in place.
+
+        Args:
+            done: Optional (B,) bool mask for batched states; only the games
+                  where it is True are reset. Resets everything when None.
+        """
+        xp = self.xp
+        if done is None:
+            xp.copyto(self.pos, self._initial_pos)
+            xp.copyto(self.vel, self._initial_vel)
+            return
+        mask = xp.asarray(done, dtype=bool)[:, None, None]
+        xp.copyto(self.pos, self._initial_pos, where=mask)
+        xp.copyto(self.vel, self._initial_vel, where=mask)
+
+    def snapshot(self):
+        """
+        Returns a copy of the mutable arrays (positions and velocities).
+
+        Radii, damping and types never change during a game, so two array
+        copies are the whole cost of a clone, e.g. for look-ahead rollouts.
+        """
+        return self.pos.copy(), self.vel.copy()
+
+    def restore(self, snapshot):
+        """Writes a snapshot() of this state back in place."""
+        pos, vel = snapshot
+        self.xp.copyto(self.pos, pos)
+        self.xp.copyto(self.vel, vel)
+
+
+    @property
+    def entities(self):
+        """Per-entity views, for code that works on one entity at a time."""
+        return [EntityView(self, i) for i in range(len(self.entity_types))]
+
+
+class EntityView:
+    """
+    Entity-shaped access to row `index` of a State.
+
+    Holds no data of its own: reads return views into the State arrays and
+    writes go straight to them, so the SoA layout stays the only copy.
+    """
+    __slots__ = ('_state', 'index')
+
+    def __init__(self, state, index):
+        self._state = state
+        self.index = index
+
+    @property
+    def entity_type(self):
+        return self._state.entity_types[self.index]
+
+    @property
+    def position(self):
+        return self._state.pos[..., self.index, :]
+
+    @position.setter
+    def position(self, value):
+        self._state.pos[..., self.index, :] = value
+
+    @property
+    def velocity(self):
+        return self._state.vel[..., self.index, :]
+
+    @velocity.setter
+    def velocity(self, value):
+        self._state.vel[..., self.index, :] = value
+
+    @property
+    def radius(self):
+        return self._state.radius[..., self.index]
+
+    @property
+    def damping_factor(self):
+        return self._state.damping[..., self.index]
+
+    def __repr__(self):
+        return f"EntityView({self.entity_type!r}, index={self.index})"
 
 
 # --- Movement Function ---
 # This function updates position based on velocity and time delta
 # Could be in a separate movement.py, but included here for now
-def update_movement(entity, dt):
-    """Updates entity position based on its velocity and time delta."""
-    entity.position[0] += entity.velocity[0] * dt
-    entity.position[1] += entity.velocity[1] * dt
+def update_movement(pos, vel, dt):
+    """Updates positions in place based on velocities and time delta."""
+    pos += vel * dt
 
 # --- Force Functions ---
-def apply_damping(entity, damping_factor):
-    """Reduces the entity's velocity by a damping factor."""
-    entity.velocity[0] *= damping_factor
-    entity.velocity[1] *= damping_factor
+def apply_damping(vel, damping):
+    """Reduces velocities in place by the per-entity damping factors."""
+    vel *= damping[:, None]
 
 # --- Collision Functions ---
-def check_boundary_collision(entity, boundaries):
-    """Checks if an entity collides with the field boundaries."""
-    min_x, max_x, min_y, max_y = boundaries
-    collided = False
-    if entity.position[0] - entity.radius < min_x or entity.position[0] + entity.radius > max_x:
-        collided = True
-    if entity.position[1] - entity.radius < min_y or entity.position[1] + entity.radius > max_y:
-        collided = True
-    return collided
-
-def resolve_boundary_collision(entity, boundaries):
-    """Resolves collision with boundaries by reversing velocity and adjusting position."""
-    min_x, max_x, min_y, max_y = boundaries
-
-    # Resolve X boundary collision
-    if entity.position[0] - entity.radius < min_x:
-        entity.position[0] = min_x + entity.radius # Correct position
-        entity.velocity[0] *= -1 # Reverse velocity
-    elif entity.position[0] + entity.radius > max_x:
-        entity.position[0] = max_x - entity.radius # Correct position
-        entity.velocity[0] *= -1 # Reverse velocity
-
-    # Resolve Y boundary collision
-    if entity.position[1] - entity.radius < min_y:
-        entity.position[1] = min_y + entity.radius # Correct position
-        entity.velocity[1] *= -1 # Reverse velocity
-    elif entity.position[1] + entity.radius > max_y:
-        entity.position[1] = max_y - entity.radius # Correct position
-        entity.velocity[1] *= -1 # Reverse velocity
+def reflect_bounds(pos, vel, radius, is_ball):
+    """
+    Bounces the ball entities off the field boundaries in place.
+
+    On every axis where an entity's edge is outside the field, its velocity is
+    reversed and its position clamped back inside, in a single pass.
+    """
+    r = radius[:, None]
+    lo = _FIELD_LO + r
+    hi = _FIELD_HI - r
+    hit = (pos < lo) | (pos > hi)
+    hit &= is_ball[:, None]
+    if hit.any():
+        np.negative(vel, out=vel, where=hit) # Reverse velocity
+        np.copyto(pos, np.clip(pos, lo, hi), where=hit) # Correct position
+
+def contact_distances_sq(radius):
+    """
+    Squared radius sums of every pair of entities, as an (N, N) table.
+
+    Radii do not change during a game, so the table can be built once and
+    passed to every overlaps() call, e.g. across sub-steps.
+    """
+    r = radius[:, None] + radius[None, :]
+    return r * r
+
+def overlaps(pos, radius, contact_sq=None):
+    """
+    Tests every pair of entities for overlap in one broadcast expression.
+
+    Two circles overlap when the squared distance between their centres is
+    below the squared sum of their radii, so no square root is taken.
+
+    Args:
+        pos: (N, 2) positions, e.g. State.pos.
+        radius: (N,) radii, e.g. State.radius.
+        contact_sq: Optional contact_distances_sq(radius) table, so that it
+                    is not recomputed on every call.
+
+    Returns:
+        Symmetric (N, N) bool matrix, True where entities i and j overlap.
+        The diagonal is False.
+    """
+    if contact_sq is None:
+        contact_sq = contact_distances_sq(radius)
+    dx = pos[:, None, 0] - pos[None, :, 0]
+    dy = pos[:, None, 1] - pos[None, :, 1]
+    hit = dx * dx + dy * dy < contact_sq
+    np.fill_diagonal(hit, False)
+    return hit
+
+# Below this many entities, the dense overlaps() matrix is cheaper than the grid search.
+GRID_MIN_ENTITIES = 64
+
+def overlapping_pairs(pos, radius):
+    """
+    Finds all index pairs (i, j), i < j, of overlapping entities.
+
+    From GRID_MIN_ENTITIES entities on (and with Numba installed), candidates
+    come from the close_pairs_kernel grid with cells of twice the largest
+    radius, so only entities in neighbouring cells are tested against their
+    radii. Smaller sets use the dense overlaps() matrix.
+
+    Args:
+        pos: (N, 2) float32 positions, e.g. State.pos.
+        radius: (N,) float32 radii, e.g. State.radius.
+
+    Returns:
+        (K, 2) int32 array of the overlapping pairs.
+    """
+    if close_pairs_kernel is None or len(radius) < GRID_MIN_ENTITIES:
+        i, j = np.nonzero(np.triu(overlaps(pos, radius)))
+        return np.stack([i, j], axis=1).astype(np.int32)
+
+    max_radius = radius.max()
+    if max_radius <= 0:
+        return np.empty((0, 2), dtype=np.int32)
+    # No two circles further apart than the largest radius sum can overlap
+    candidates = close_pairs_kernel(pos, np.float32(2 * max_radius))
+    i, j = candidates[:, 0], candidates[:, 1]
+    d = pos[j] - pos[i]
+    r = radius[i] + radius[j]
+    return candidates[np.einsum('ij,ij->i', d, d) < r * r]
+
+def resolve_collisions(pos, vel, inv_mass, pairs, restitution=1.0):
+    """
+    Applies the collision impulses of all colliding pairs to `vel` in place.
+
+    Every pair is resolved from the velocities before the call, and the
+    impulses of an entity that is in several pairs add up.
+
+    Args:
+        pos: (N, 2) positions, e.g. State.pos.
+        vel: (N, 2) velocities, e.g. State.vel; updated in place.
+        inv_mass: (N,) inverse masses, 0 for immovable entities.
+        pairs: (K, 2) index pairs (i, j), e.g. from overlapping_pairs().
+        restitution: 1 for elastic collisions, 0 for perfectly inelastic ones.
+    """
+    i, j = pairs[:, 0], pairs[:, 1]
+    normal = pos[j] - pos[i]
+    normal /= np.sqrt(np.einsum('ij,ij->i', normal, normal))[:, None] + 1e-30
+    # Closing speed along the normal (from i to j); pairs moving apart get 0
+    vn = np.maximum(np.einsum('ij,ij->i', vel[i] - vel[j], normal), 0)
+    m_i = inv_mass[i]
+    m_j = inv_mass[j]
+    impulse = normal * (-(1 + restitution) * vn / (m_i + m_j + 1e-30))[:, None]
+    np.add.at(vel, i, impulse * m_i[:, None])
+    np.add.at(vel, j, impulse * -m_j[:, None])
+
+# --- Fused NumPy Step ---
+def _update_physics_numpy(pos, vel, radius, damping, ball_rows, dt):
+    """
+    apply_damping, update_movement and reflect_bounds in one function body.
+
+    Same result as calling the three helpers in turn, but without the call
+    layers and with the arithmetic done in place. Damping and movement are one
+    pass over every entity; the boundary test then runs on the ball rows only.
+    """
+    np.multiply(vel, damping[:, None], out=vel)
+    pos += vel * dt
+
+    ball_pos = pos[ball_rows]
+    ball_vel = vel[ball_rows]
+    r = radius[ball_rows][:, None]
+    lo = _FIELD_LO + r
+    hi = _FIELD_HI - r
+    hit = (ball_pos < lo) | (ball_pos > hi)
+    if hit.any():
+        np.negative(ball_vel, out=ball_vel, where=hit)
+        vel[ball_rows] = ball_vel
+        pos[ball_rows] = np.clip(ball_pos, lo, hi) # No-op on the axes that were inside
+
+# --- Compiled Kernel ---
+def _step_entity(i, pos, vel, radius, damping, is_ball, dt, min_x, max_x, min_y, max_y):
+    """
+    Fused damping, movement and boundary reflection for entity `i`.
+
+    Same semantics as the NumPy helpers above; values stay in locals so the
+    velocity and position of the entity are read and written exactly once.
+    Only touches row `i`, so entities can be stepped in any order or in parallel.
+    """
+    d = damping[i]
+    vx = vel[i, 0] * d
+    vy = vel[i, 1] * d
+    px = pos[i, 0] + vx * dt
+    py = pos[i, 1] + vy * dt
+    if is_ball[i]:
+        # Clamp with min/max instead of one branch per wall; an axis hit a
+        # wall exactly when the clamp moved it, which selects the reflection
+        r = radius[i]
+        cx = min(max(px, min_x + r), max_x - r)
+        cy = min(max(py, min_y + r), max_y - r)
+        vx = -vx if cx != px else vx
+        vy = -vy if cy != py else vy
+        px = cx
+        py = cy
+    pos[i, 0] = px
+    pos[i, 1] = py
+    vel[i, 0] = vx
+    vel[i, 1] = vy
+
+def _update_physics_kernel(pos, vel, radius, damping, is_ball, dt, min_x, max_x, min_y, max_y):
+    """Steps every entity in a single serial pass."""
+    for i in range(pos.shape[0]):
+        _step_entity(i, pos, vel, radius, damping, is_ball, dt, min_x, max_x, min_y, max_y)
+
+def _update_physics_kernel_parallel(pos, vel, radius, damping, is_ball, dt, min_x, max_x, min_y, max_y):
+    """
+    Steps every entity with the entity axis split across threads.
+
+    The per-entity update has no cross-entity dependencies. Interactions between
+    entities (e.g. ball-player collisions) must run in a separate serial pass.
+    """
+    for i in prange(pos.shape[0]):
+        _step_entity(i, pos, vel, radius, damping, is_ball, dt, min_x, max_x, min_y, max_y)
+
+# Cell offsets (dx, dy) visited from each grid cell: itself plus half of its 8
+# neighbours, so every pair of neighbouring cells is compared exactly once
+_HALF_NEIGHBOURHOOD = ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1))
+
+def _close_pairs_kernel(pos, max_dist):
+    """
+    Compiled version of simulation.close_pairs' uniform-grid search.
+
+    The points are sorted by grid cell key, so each cell is a contiguous run of
+    `order` that is found by binary search instead of through a dict. Runs the
+    search twice: once to count the pairs, once to fill the exactly sized output.
+
+    Returns:
+        (K, 2) int32 array of the pairs (i, j), i < j, closer than `max_dist`.
+    """
+    n = pos.shape[0]
+    cx = np.empty(n, dtype=np.int64)
+    cy = np.empty(n, dtype=np.int64)
+    for i in range(n):
+        cx[i] = np.int64(math.floor(pos[i, 0] / max_dist))
+        cy[i] = np.int64(math.floor(pos[i, 1] / max_dist))
+    if n == 0:
+        return np.empty((0, 2), dtype=np.int32)
+    # Keys are padded by one cell on each side so neighbour offsets never wrap
+    width = cy.max() - cy.min() + 3
+    keys = (cx - cx.min() + 1) * width + (cy - cy.min() + 1)
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    max_dist_sq = max_dist * max_dist
+
+    out = np.empty((0, 2), dtype=np.int32)
+    for fill in (False, True):
+        count = 0
+        for a in range(n):
+            i = order[a]
+            key = sorted_keys[a]
+            for dx, dy in _HALF_NEIGHBOURHOOD:
+                if dx == 0 and dy == 0:
+                    # Within the own cell, only the points after i
+                    lo = a + 1
+                    hi = np.searchsorted(sorted_keys, key, side='right')
+                else:
+                    other = key + dx * width + dy
+                    lo = np.searchsorted(sorted_keys, other, side='left')
+                    hi = np.searchsorted(sorted_keys, other, side='right')
+                for b in range(lo, hi):
+                    j = order[b]
+                    ex = pos[j, 0] - pos[i, 0]
+                    ey = pos[j, 1] - pos[i, 1]
+                    if ex * ex + ey * ey < max_dist_sq:
+                        if fill:
+                            out[count, 0] = min(i, j)
+                            out[count, 1] = max(i, j)
+                        count += 1
+        if not fill:
+            out = np.empty((count, 2), dtype=np.int32)
+    return out
+
+# Below this many entities, starting the worker threads costs more than the loop itself.
+PARALLEL_MIN_ENTITIES = 10_000
+
+if numba is not None:
+    # Explicit signature: compiled eagerly at import (and cached on disk), so the
+    # first simulation step does not pay the JIT latency.
+    # The cache records the importing module name, so it is skipped when this file
+    # runs as a script; otherwise later `src.zzocker.physics` imports could not load it.
+    _CACHE = __name__ != '__main__'
+    _KERNEL_SIGNATURE = 'void(f4[:,:], f4[:,:], f4[:], f4[:], b1[:], f4, f4, f4, f4, f4)'
+    _step_entity = numba.njit(inline='always', cache=_CACHE, fastmath=True)(_step_entity)
+    # nogil: the kernels only touch the arrays they are given, so other Python
+    # threads (e.g. AI code, or other rollouts) can run while physics steps.
+    _update_physics_kernel = numba.njit(
+        _KERNEL_SIGNATURE, cache=_CACHE, fastmath=True, nogil=True,
+    )(_update_physics_kernel)
+    _update_physics_kernel_parallel = numba.njit(
+        _KERNEL_SIGNATURE, cache=_CACHE, fastmath=True, nogil=True, parallel=True,
+    )(_update_physics_kernel_parallel)
+    close_pairs_kernel = numba.njit(
+        'i4[:,:](f4[:,:], f4)', cache=_CACHE, fastmath=True, nogil=True,
+    )(_close_pairs_kernel)
+else:
+    _update_physics_kernel = None
+    _update_physics_kernel_parallel = None
+    close_pairs_kernel = None
+
+if cupy is not None:
+    # GPU version of _step_entity: one thread per entity, a single launch per update.
+    # pos/vel are raw so each thread can read and write both components of its row.
+    _update_physics_cuda = cupy.ElementwiseKernel(
+        'float32 radius, float32 damping, bool is_ball, float32 dt, '
+        'float32 min_x, float32 max_x, float32 min_y, float32 max_y',
+        'raw float32 pos, raw float32 vel',
+        '''
+        float vx = vel[2 * i] * damping;
+        float vy = vel[2 * i + 1] * damping;
+        float px = pos[2 * i] + vx * dt;
+        float py = pos[2 * i + 1] + vy * dt;
+        if (is_ball) {
+            float cx = fminf(fmaxf(px, min_x + radius), max_x - radius);
+            float cy = fminf(fmaxf(py, min_y + radius), max_y - radius);
+            vx = cx != px ? -vx : vx;
+            vy = cy != py ? -vy : vy;
+            px = cx;
+            py = cy;
+        }
+        pos[2 * i] = px;
+        pos[2 * i + 1] = py;
+        vel[2 * i] = vx;
+        vel[2 * i + 1] = vy;
+        ''',
+        'zzocker_update_physics',
+    )
+else:
+    _update_physics_cuda = None
+
+def warmup(xp=None):
+    """
+    Runs every available physics kernel once on a single-entity state.
+
+    The Numba kernels are already compiled (or loaded from the disk cache) at
+    import; this also starts the parallel kernel's thread pool and, for
+    `xp=cupy`, compiles and loads the CUDA kernel, which CuPy otherwise does
+    on the first update. Call it before timing or before a long run.
+    """
+    state = State([Entity('ball', (MIN_X, MIN_Y), (-1, -1), radius=1)], xp=xp)
+    if state.xp is not np:
+        update_physics(state, 0.0)
+        return
+    if _update_physics_kernel is None:
+        return
+    for kernel in (_update_physics_kernel, _update_physics_kernel_parallel):
+        kernel(state.pos, state.vel, state.radius, state.damping, state.is_ball,
+               0.0, MIN_X, MAX_X, MIN_Y, MAX_Y)
 
 # --- Main Physics Update Function ---
 def update_physics(state: State, dt: float):
     """
     Updates the physics state for all entities.
 
+    Uses the CUDA kernel for states on the GPU (`State(xp=cupy)`), the Numba
+    kernel when Numba is installed (multi-threaded from PARALLEL_MIN_ENTITIES
+    entities on), otherwise the vectorized NumPy helpers.
+
     Args:
         state: The current game state object.
         dt: The time delta since the last update.
     """
-    for entity in state.entities:
-        # Apply forces
-        if entity.entity_type == 'ball':
-            apply_damping(entity, BALL_DAMPING)
-        elif entity.entity_type == 'player':
-            apply_damping(entity, PLAYER_DAMPING)
-        # Add other forces here (e.g., player kick force, gravity if needed)
+    # Every entity is independent, so batched (B, N, ...) arrays are processed as
+    # B*N flat rows (views, the arrays are contiguous).
+    pos = state.pos.reshape(-1, 2)
+    vel = state.vel.reshape(-1, 2)
+    radius = state.radius.reshape(-1)
+    damping = state.damping.reshape(-1)
+    is_ball = state.is_ball.reshape(-1)
+
+    if state.xp is not np:
+        # Stays on the device; nothing is copied back to the host here
+        _update_physics_cuda(radius, damping, is_ball, dt, MIN_X, MAX_X, MIN_Y, MAX_Y, pos, vel)
+        return
 
-        # Update movement based on current velocity
-        update_movement(entity, dt)
+    if _update_physics_kernel is not None:
+        kernel = _update_physics_kernel
+        if pos.shape[0] >= PARALLEL_MIN_ENTITIES:
+            kernel = _update_physics_kernel_parallel
+        kernel(pos, vel, radius, damping, is_ball, dt, MIN_X, MAX_X, MIN_Y, MAX_Y)
+        return
 
-        # Handle collisions
-        if entity.entity_type == 'ball':
-            if check_boundary_collision(entity, FIELD_BOUNDARIES):
-                resolve_boundary_collision(entity, FIELD_BOUNDARIES)
-        # Add other collision checks here (e.g., ball-player, player-player)
+    # Damping, movement and boundary bounces in one fused pass (damping is baked
+    # per entity and only the ball rows are bounced, so no branch on entity type)
+    _update_physics_numpy(pos, vel, radius, damping, state.ball_rows, dt)
+    # Add other forces and collision checks here (e.g., kick force, ball-player)
 
 # Example of how this might be used in a game loop (not part of the required output)
 if __name__ == '__main__':
@@ -107,26 +559,26 @@ if __name__ == '__main__':
     dt = 1/60.0 # Assume 60 FPS update rate
 
     print("Initial State:")
-    for entity in game_state.entities:
-        print(f"{entity.entity_type}: Pos={entity.position}, Vel={entity.velocity}")
+    for i, entity_type in enumerate(game_state.entity_types):
+        print(f"{entity_type}: Pos={game_state.pos[i]}, Vel={game_state.vel[i]}")
 
     # Simulate a few steps
     for i in range(100):
         update_physics(game_state, dt)
-        # print(f"Step {i+1}: Ball Pos={game_state.entities[0].position}, Vel={game_state.entities[0].velocity}")
+        # print(f"Step {i+1}: Ball Pos={game_state.pos[0]}, Vel={game_state.vel[0]}")
 
     print("\nState after 100 steps:")
-    for entity in game_state.entities:
-        print(f"{entity.entity_type}: Pos={entity.position}, Vel={entity.velocity}")
+    for i, entity_type in enumerate(game_state.entity_types):
+        print(f"{entity_type}: Pos={game_state.pos[i]}, Vel={game_state.vel[i]}")
 
     # Example: Push the ball towards a wall
-    game_state.entities[0].velocity = [200, 50]
+    game_state.vel[0] = (200, 50)
     print("\nBall pushed towards wall:")
-    print(f"Initial Ball Pos={game_state.entities[0].position}, Vel={game_state.entities[0].velocity}")
+    print(f"Initial Ball Pos={game_state.pos[0]}, Vel={game_state.vel[0]}")
 
     for i in range(100):
          update_physics(game_state, dt)
 
     print("\nState after 100 steps (after push):")
-    for entity in game_state.entities:
-        print(f"{entity.entity_type}: Pos={entity.position}, Vel={entity.velocity}")
\ No newline at end of file
+    for i, entity_type in enumerate(game_state.entity_types):
+        print(f"{entity_type}: Pos={game_state.pos[i]}, Vel={game_state.vel[i]}")
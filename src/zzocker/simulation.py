@@ -1,36 +1,251 @@
+import collections
+import logging
+import multiprocessing
 import time
+import typing
+
+import numpy as np
+
 from . import state
 from . import physics
-from . import player_ai
 from . import actions # Assuming actions structure is defined here
 # Potentially need imports for specific event data structures if defined elsewhere
 # from . import events # Example: if there's an events module
 
+# Order in which the action kinds are applied within a step
+_ACTION_ORDER = (actions.MOVE, actions.PASS, actions.SHOOT, actions.TACKLE)
+
+logger = logging.getLogger(__name__)
+
+class TeamAI(typing.Protocol):
+    """
+    What SimulationManager needs from a team AI, e.g. ai.batch_ai.BallSeekerAI.
+
+    An AI may also define get_actions_batched(game_state, out), which writes
+    the actions of all players into the full ActionBatch `out`; it is used
+    when the same object plays both teams.
+    """
+
+    def get_actions(self, game_state: state.GameState, team_id: int, out: actions.ActionBatch) -> None:
+        """Writes the actions of team `team_id` (1 or 2) into its lanes `out`."""
+
+# Players closer than this (field units) are in tackling range of each other.
+# Also the cell size of the spatial hash, so only neighbouring cells need checking.
+TACKLE_RANGE = 30.0
+
+def close_pairs(positions, max_dist):
+    """
+    Finds all index pairs (i, j), i < j, of points closer than `max_dist`.
+
+    Points are hashed into a grid of `max_dist`-sized cells and only points in
+    the same or adjacent cells are compared, instead of all N*(N-1)/2 pairs.
+
+    Args:
+        positions: (N, 2) array of positions.
+        max_dist: The distance threshold.
+
+    Returns:
+        A list of (i, j) tuples.
+    """
+    if physics.close_pairs_kernel is not None:
+        # Same search, compiled; distances are compared in float32
+        pairs = physics.close_pairs_kernel(np.ascontiguousarray(positions, dtype=np.float32),
+                                           np.float32(max_dist))
+        return list(map(tuple, pairs.tolist()))
+
+    cells = np.floor_divide(positions, max_dist).astype(np.int64).tolist()
+    grid = {}
+    for index, (cx, cy) in enumerate(cells):
+        grid.setdefault((cx, cy), []).append(index)
+
+    xy = positions.tolist()
+    max_dist_sq = max_dist * max_dist
+    pairs = []
+    # Bound to locals once; the loops below run for every candidate pair
+    add_pair = pairs.append
+    get_cell = grid.get
+    neighbourhood = physics._HALF_NEIGHBOURHOOD # Same visiting order as the compiled kernel
+    for (cx, cy), members in grid.items():
+        for dx, dy in neighbourhood:
+            others = members if dx == dy == 0 else get_cell((cx + dx, cy + dy))
+            if others is None:
+                continue
+            for n, i in enumerate(members):
+                xi, yi = xy[i]
+                # Within the own cell, only look at the members after i
+                for j in (others[n + 1:] if others is members else others):
+                    xj, yj = xy[j]
+                    ex = xj - xi
+                    ex *= ex
+                    if ex >= max_dist_sq: # Rejected on x alone, skip the y term
+                        continue
+                    ey = yj - yi
+                    if ex + ey * ey < max_dist_sq:
+                        add_pair((i, j) if i < j else (j, i))
+    return pairs
+
+def _out_of_range_tackle(tackler_id: int, tackled_id: int) -> actions.ActionResult:
+    """The failed result of a tackle on a player who is not an opponent in TACKLE_RANGE."""
+    return actions.ActionResult(
+        False, "Player %s is not in tackling range of player %s",
+        data={"action_type": "tackle", "tackler_id": tackler_id, "tackled_id": tackled_id,
+              "outcome": "failure"},
+        message_args=(tackler_id, tackled_id))
+
+def kickoff_game_state(players_per_team: int = 11,
+                       match_duration: float = state.MATCH_DURATION) -> state.GameState:
+    """
+    Builds a GameState at kick-off on the physics field.
+
+    The ball rests on the centre spot and each team stands in a line across
+    its own half, home players first as SimulationManager expects. Being a
+    module-level function it is picklable, so it (or a functools.partial of
+    it) can be passed as SimulationManager.run_many's game_state_factory.
+
+    Args:
+        players_per_team: Number of players on each team.
+        match_duration: See GameState.
+
+    Returns:
+        A new GameState.
+    """
+    min_x, max_x, min_y, max_y = physics.FIELD_BOUNDARIES
+    width, height = max_x - min_x, max_y - min_y
+    players = []
+    for team, x in ((state.Team.HOME, min_x + width / 4), (state.Team.AWAY, max_x - width / 4)):
+        for i in range(players_per_team):
+            y = min_y + height * (i + 1) / (players_per_team + 1)
+            players.append(state.Player(
+                id=len(players), team=team, position=(x, y), velocity=(0.0, 0.0), orientation=0.0,
+                is_controlled_by_ai=True, stamina=1.0, attributes={}, mass=75.0, radius=15.0))
+    ball = state.Ball(position=(min_x + width / 2, min_y + height / 2), velocity=(0.0, 0.0),
+                      mass=0.43, radius=10.0)
+    return state.GameState(players, ball, match_duration=match_duration)
+
+def _run_one_game(job):
+    """
+    Plays one game to the end in a worker process of SimulationManager.run_many.
+
+    Top-level so that multiprocessing can pickle it by reference.
+
+    Args:
+        job: (ai_factory1, ai_factory2, game_state_factory, seed) tuple.
+
+    Returns:
+        (seed, final score) tuple.
+    """
+    ai_factory1, ai_factory2, game_state_factory, seed = job
+    actions.seed_outcomes(seed)
+    sim = SimulationManager(ai_factory1(), ai_factory2(), game_state=game_state_factory())
+    sim.run()
+    return seed, sim.game_state.score
+
 class SimulationManager:
     """
     Manages the main simulation loop of a game.
     """
-    def __init__(self, team1_ai: player_ai.BaseAI, team2_ai: player_ai.BaseAI, timestep: float = 1/60):
+    __slots__ = (
+        'game_state', 'team1_ai', 'team2_ai', 'timestep', 'physics_state', 'events',
+        '_timestep_s', '_timestep_f32', '_tick', '_is_running', '_debug', '_log_buf', '_frame_logger',
+        '_actions', '_team1_actions', '_team2_actions',
+        '_player_pos', '_player_vel',
+        '_get_team1_actions', '_get_team2_actions', '_get_all_actions', '_update_physics', '_event_handlers',
+    )
+
+    def __init__(self, team1_ai: TeamAI, team2_ai: TeamAI, timestep: float = 1/60,
+                 game_state: state.GameState | None = None, debug: bool = False,
+                 frame_logger=None, trace_frames: bool = False, record_events: bool = False):
         """
         Initializes the simulation manager.
 
         Args:
             team1_ai: The AI object for team 1.
-            team2_ai: The AI object for team 2.
+            team2_ai: The AI object for team 2. Passing the same object as
+                      team1_ai whose class defines get_actions_batched(game_state, out)
+                      lets it decide for all players in one call per step.
             timestep: The time step for each simulation step in seconds.
+            game_state: The initial game state (default: kickoff_game_state()). Its players
+                        must be ordered team 1 first; each team owns half of the action lanes.
+            debug: Log the full traceback when a step raises.
+            frame_logger: Optional callable(tick, game_state) called after every step.
+            trace_frames: Record (tick, ball position) after every step into a
+                          bounded in-memory trace, read back with get_trace().
+            record_events: Record the outcome of every non-move action into
+                           self.events (otherwise None). The log grows with
+                           every such action, so read and clear() it regularly.
         """
         # 1. Initialize the game state
-        self.game_state = state.GameState()
+        self.game_state = kickoff_game_state() if game_state is None else game_state
         self.team1_ai = team1_ai
         self.team2_ai = team2_ai
         self.timestep = timestep
+        self._timestep_s = float(timestep)
+        self._timestep_f32 = np.float32(timestep) # Physics runs in float32; no per-step conversion
+        self._tick = 0 # Steps taken; the time is derived from it, so it does not drift
         self._is_running = False
+        self._debug = debug
+        self._log_buf = collections.deque(maxlen=10_000)
+        if trace_frames and frame_logger is None:
+            frame_logger = self._trace_frame
+        self._frame_logger = frame_logger
+
+        # Action buffer reused every step; each AI writes into its team's lanes
+        n_players = len(self.game_state.players)
+        self._actions = actions.ActionBatch(n_players)
+        self._team1_actions = self._actions.lanes(0, n_players // 2)
+        self._team2_actions = self._actions.lanes(n_players // 2, n_players)
+
+        # Physics runs on SoA arrays: row 0 is the ball, rows 1.. the players in lane order
+        self.physics_state = self._build_physics_state()
+        self._player_pos = self.physics_state.pos[1:]
+        self._player_vel = self.physics_state.vel[1:]
+        self._bind_game_state()
+        # Outcomes of the non-move actions, if asked for; read and clear() it from the caller
+        self.events = actions.EventLog() if record_events else None
+
+        # Bound methods used every step, looked up once
+        self._get_team1_actions = team1_ai.get_actions
+        self._get_team2_actions = team2_ai.get_actions
+        # One policy for both teams: a single call over the whole batch
+        self._get_all_actions = getattr(team1_ai, 'get_actions_batched', None) if team1_ai is team2_ai else None
+        self._update_physics = physics.update_physics
+        # The order of checks might be important depending on rule interactions:
+        # tackles/interceptions first as they affect possession, then passes
+        # and shots, offsides (after pass completion) and goals last, as a goal
+        # might end the half/game.
+        self._event_handlers = (
+            self._handle_tackle,
+            self._handle_pass,
+            self._handle_shot,
+            self._check_offside,
+            self._check_goal,
+        )
 
         # Optional: Initialize AIs with the game state or relevant info if needed
         # self.team1_ai.initialize(self.game_state, team_id=1) # Example
         # self.team2_ai.initialize(self.game_state, team_id=2) # Example
 
 
+    @property
+    def current_time(self) -> float:
+        """Simulated time in seconds, computed from the step count."""
+        return self._tick * self._timestep_s
+
+    def snapshot(self):
+        """
+        Captures the simulation state for a later restore().
+
+        The entity state is taken from the physics arrays (two array copies)
+        rather than by deep-copying the GameState objects.
+        """
+        return self._tick, self.game_state.score, self.physics_state.snapshot()
+
+    def restore(self, snapshot):
+        """Rewinds the simulation to a snapshot() taken from this manager."""
+        self._tick, self.game_state.score, physics_snapshot = snapshot
+        self.game_state.game_time = self.current_time
+        self.physics_state.restore(physics_snapshot)
+
     def step(self) -> bool:
         """
         Performs one step of the simulation.
@@ -41,105 +256,225 @@ class SimulationManager:
         if not self._is_running or self.game_state.is_game_over():
             return False
 
-        # Advance time
-        self.game_state.current_time += self.timestep
+        # Advance time; the game state's clock follows the step count
+        self._tick += 1
+        self.game_state.game_time = self.current_time
 
         # 3. Get the current state (already self.game_state)
 
-        # 4. Call AI logic to determine actions
-        try:
-            # AIs receive the current state and return actions for their players
-            # Actions should be a dictionary mapping player_id to action data (using actions.py structure)
-            team1_actions = self.team1_ai.get_actions(self.game_state, team_id=1)
-            team2_actions = self.team2_ai.get_actions(self.game_state, team_id=2)
-        except Exception as e:
-            print(f"Error getting AI actions: {e}")
-            self.stop()
-            return False
-
-        # Combine actions from both teams
-        all_actions = {}
-        all_actions.update(team1_actions)
-        all_actions.update(team2_actions)
-
-        # Optional: Validate actions against allowed actions for the state/player
-
-        # 5. Pass state and actions to the physics engine to calculate the next state
-        try:
-            # Assuming physics modifies game_state in place
-            physics.update_physics(self.game_state, all_actions, self.timestep)
-        except Exception as e:
-            print(f"Error during physics update: {e}")
-            self.stop()
-            return False
-
-        # 6. Check and handle game events (goals, fouls, passes, shots, etc.)
-        # Events might change the game state significantly (e.g., stop play, reset positions)
+        # A single handler for the whole step; see _on_error for the failing stage
         try:
+            # 4. Call AI logic to determine actions
+            self._actions.clear()
+            # AIs receive the current state and write the actions of their players
+            # into their lanes of the shared actions.ActionBatch (idle players stay NO_ACTION)
+            if self._get_all_actions is not None:
+                self._get_all_actions(self.game_state, self._actions)
+            else:
+                self._get_team1_actions(self.game_state, 1, self._team1_actions)
+                self._get_team2_actions(self.game_state, 2, self._team2_actions)
+
+            # Optional: Validate actions against allowed actions for the state/player
+
+            # Apply all actions, one action type at a time
+            self._apply_actions(self._actions)
+
+            # 5. Advance every entity with one vectorized physics update. With
+            # every entity at rest (e.g. after a kick-off reset) the update
+            # would change nothing, so it is skipped.
+            if self.physics_state.vel.any():
+                self._update_physics(self.physics_state, self._timestep_f32)
+
+            # 6. Check and handle game events (goals, fouls, passes, shots, etc.)
+            # Events might change the game state significantly (e.g., stop play, reset positions)
             self._check_and_handle_events()
         except Exception as e:
-            print(f"Error during event handling: {e}")
-            self.stop()
+            self._on_error(e)
             return False
 
+        if self._frame_logger is not None:
+            self._frame_logger(self._tick, self.game_state)
+
         # 7. Check for game over conditions (handled by game_state.is_game_over())
 
         return self._is_running and not self.game_state.is_game_over()
 
 
+    def start(self):
+        """
+        Starts the simulation, so that step() advances it until stop() or the end of the game.
+
+        run() calls it; callers driving step() themselves call it first.
+        """
+        self._is_running = True
+        logger.info("Simulation started.")
+
     def run(self):
         """
         Runs the main simulation loop until the game is over or stopped.
         """
-        self._is_running = True
-        print("Simulation started.")
+        self.start()
 
         # Optional: Add initial state setup/broadcast if needed
         # self.game_state.setup_initial_state() # Example
 
-        while self.step():
+        step = self.step
+        while step():
             # The main logic for each frame is in the step() method.
             # Add any necessary delays or visualization updates here if needed.
             # Example: time.sleep(self.timestep) # If running slower than real-time
             pass
 
-        print("Simulation finished.")
+        logger.info("Simulation finished.")
         if self.game_state.is_game_over():
-            print(f"Game Over! Result: {self.game_state.score}") # Example
+            logger.info("Game Over! Result: %s", self.game_state.score) # Example
+
 
+    @staticmethod
+    def run_many(ai_factory1, ai_factory2, n_games: int, workers: int | None = None,
+                 game_state_factory=kickoff_game_state, seed: int = 0):
+        """
+        Plays `n_games` independent games in parallel worker processes.
+
+        Each game runs in its own process, so the games use all CPU cores
+        instead of sharing one interpreter. Workers are started with the
+        'spawn' method so they never inherit an already initialized Numba
+        runtime. Every kernel a game runs (physics.update_physics and the
+        close_pairs broad phase) is compiled with cache=True, so workers
+        load it from Numba's on-disk cache instead of compiling it again.
+
+        Args:
+            ai_factory1: Picklable (module-level) callable returning the team 1 AI.
+            ai_factory2: Picklable callable returning the team 2 AI.
+            n_games: Number of games to play.
+            workers: Number of worker processes (default: one per CPU).
+            game_state_factory: Picklable callable returning a fresh initial GameState
+                                (default: kickoff_game_state).
+            seed: Game n seeds its action outcomes with `seed + n`.
+
+        Returns:
+            A list of (seed, final score) tuples in completion order.
+        """
+        jobs = [(ai_factory1, ai_factory2, game_state_factory, seed + n) for n in range(n_games)]
+        with multiprocessing.get_context('spawn').Pool(workers) as pool:
+            return list(pool.imap_unordered(_run_one_game, jobs))
+
+    def _trace_frame(self, tick, game_state):
+        """Frame logger used with trace_frames: keeps the tick and ball position."""
+        self._log_buf.append((tick, tuple(game_state.ball.position.tolist())))
+
+    def get_trace(self):
+        """Returns and clears the frames recorded so far (oldest first)."""
+        trace = list(self._log_buf)
+        self._log_buf.clear()
+        return trace
+
+    def _on_error(self, error):
+        """
+        Reports an exception raised during a step and stops the simulation.
+
+        In debug mode the full traceback is logged, which names the stage
+        (AI, actions, physics or events) that failed.
+        """
+        if self._debug:
+            logger.exception("Error during simulation step: %r", error)
+        else:
+            logger.error("Error during simulation step: %r", error)
+        self.stop()
 
     def stop(self):
         """
         Stops the simulation loop.
         """
         self._is_running = False
-        print("Simulation stopped.")
+        logger.info("Simulation stopped.")
 
-    def _check_and_handle_events(self):
-        """
-        Checks for and handles game events based on the current state.
-        Modifies game_state accordingly.
+    def _apply_actions(self, batch):
         """
-        # The order of checks might be important depending on rule interactions
-        # For example, a tackle might prevent a pass/shot from happening.
-        # A goal check should probably be last as it might end the half/game.
+        Applies the actions of every player, grouped by action type.
 
-        # Check for tackles/interceptions first as they affect possession
-        self._handle_tackle()
+        All moves are applied first, in one vectorized write into the physics
+        positions, then all passes, shots and tackles, so the same apply code
+        runs back to back instead of alternating per player. The outcome of
+        every non-move action is recorded in self.events, if enabled. A tackle only gets
+        a chance to succeed when its target is an opponent within
+        TACKLE_RANGE; any other tackle fails.
 
-        # Check for passes (successful or unsuccessful)
-        # This might depend on the outcome of tackles
-        self._handle_pass()
+        Args:
+            batch: actions.ActionBatch with one lane per player in game_state.players.
 
-        # Check for shots
-        # This might depend on possession and player action
-        self._handle_shot()
+        Returns:
+            A list of (player_id, ActionResult) tuples for the non-move actions,
+            in application order.
+        """
+        actions.apply_moves(self._player_pos, batch)
+        players = self.game_state.players
+        record = self.events.record if self.events is not None else None
+        outcome_codes = actions.OUTCOME_CODES
+        results = []
+        for kind in _ACTION_ORDER[1:]:
+            lanes = np.flatnonzero(batch.kinds == kind)
+            # Broad phase, only run on steps where somebody tackles
+            contacts = self._tackle_contacts() if kind == actions.TACKLE and lanes.size else None
+            for lane in lanes:
+                player = players[lane]
+                action = batch.get(lane)
+                if contacts is not None and (player.id, action.target_player_id) not in contacts:
+                    result = _out_of_range_tackle(player.id, action.target_player_id)
+                else:
+                    result = action.apply(self.game_state, player)
+                if record is not None:
+                    record(self._tick, player.id, kind, outcome_codes.get(result.data.get("outcome"), 0))
+                results.append((player.id, result))
+        return results
+
+    def _tackle_contacts(self):
+        """
+        Returns the (player id, opponent id) pairs, in both orders, of the
+        opposing players within TACKLE_RANGE of each other.
+        """
+        ids = self.game_state.ids.tolist()
+        team_ids = self.game_state.team_ids.tolist()
+        contacts = set()
+        for i, j in close_pairs(self._player_pos, TACKLE_RANGE):
+            if team_ids[i] != team_ids[j]:
+                contacts.add((ids[i], ids[j]))
+                contacts.add((ids[j], ids[i]))
+        return contacts
+
+    def _build_physics_state(self) -> physics.State:
+        """Creates the physics.State for the ball and players of game_state."""
+        ball = self.game_state.ball
+        entities = [physics.Entity('ball', ball.position[:2], ball.velocity[:2], radius=ball.radius)]
+        entities.extend(
+            physics.Entity('player', player.position[:2], player.velocity[:2], radius=player.radius)
+            for player in self.game_state.players
+        )
+        return physics.State(entities)
+
+    def _bind_game_state(self):
+        """
+        Points the position and velocity of the GameState ball and players at
+        their rows of the physics arrays.
 
-        # Check for offsides (might depend on pass completion and player position)
-        self._check_offside()
+        Each becomes a float32 (2,) view, so physics updates and moves show up
+        on the GameState objects without a per-step copy, and in-place writes
+        through them (e.g. `player.velocity += kick`) reach the physics.
+        """
+        ball = self.game_state.ball
+        ball.position, ball.velocity = self.physics_state.pos[0], self.physics_state.vel[0]
+        # Also makes game_state.positions/velocities the physics player rows
+        self.game_state.bind_arrays(self._player_pos, self._player_vel)
 
-        # Check for goals (depends on shot completion and ball position)
-        self._check_goal()
+    def _check_and_handle_events(self):
+        """
+        Checks for and handles game events based on the current state.
+        Modifies game_state accordingly.
+        """
+        # Handlers run in the order set up in __init__ (tackles, passes, shots,
+        # offsides, goals)
+        for handler in self._event_handlers:
+            handler()
 
         # Add other events like fouls (outside of tackles), out of bounds, etc. later
         # self._check_out_of_bounds()
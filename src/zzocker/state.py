@@ -1,25 +1,67 @@
+import collections
+import enum
 import typing
 
+import numpy as np
+
 # Define type aliases for clarity
 Vector2D = typing.Tuple[float, float]
 Vector3D = typing.Tuple[float, float, float]
 Position = typing.Union[Vector2D, Vector3D]
 Velocity = typing.Union[Vector2D, Vector3D]
 Orientation = typing.Union[float, Vector2D, Vector3D] # Angle or vector direction
-Attributes = typing.Dict[str, float]
+Attributes = typing.Union[typing.Dict[str, float], np.ndarray]
+
+# Fixed schema of the player attributes: Player.attributes is a float32 row
+# with one entry per name, read as player.attributes[ATTR_INDEX['speed']]
+ATTR_NAMES = ('speed', 'shooting', 'passing', 'tackling', 'stamina_max')
+ATTR_INDEX = {name: index for index, name in enumerate(ATTR_NAMES)}
+
+def attributes_row(attributes: Attributes) -> np.ndarray:
+    """
+    Converts attributes to a (len(ATTR_NAMES),) float32 row.
+
+    Args:
+        attributes: A {name: value} dict (names missing from it are 0.0) or a
+                    sequence already in ATTR_NAMES order.
+    """
+    if isinstance(attributes, dict):
+        row = np.zeros(len(ATTR_NAMES), dtype=np.float32)
+        for name, value in attributes.items():
+            row[ATTR_INDEX[name]] = value
+        return row
+    return np.asarray(attributes, dtype=np.float32).reshape(len(ATTR_NAMES))
 
 # Define a placeholder type for the AI controller base class.
 # Replace typing.Any with the actual type (e.g., AIBasePlayer)
 # once the AI module structure is defined and imported.
 AIBasePlayer = typing.Any # Placeholder for the base AI controller class type
 
+class Team(enum.IntEnum):
+    """Team identity; stored as int8 in GameState.team_ids."""
+    HOME = 0
+    AWAY = 1
+
+    @classmethod
+    def from_str(cls, name: str) -> 'Team':
+        """Parses a team name such as 'home' (for I/O boundaries)."""
+        return cls[name.upper()]
+
+def as_team(team: typing.Union['Team', str, int]) -> Team:
+    """Returns `team` as a Team, accepting a Team, its name or its value."""
+    return Team.from_str(team) if isinstance(team, str) else Team(team)
+
 class Player:
     """
     Represents a single football player in the simulation.
     """
+    __slots__ = ('id', 'team', 'position', 'velocity', 'orientation',
+                 'is_controlled_by_ai', 'stamina', 'attributes', 'mass',
+                 'radius', 'ai_controller')
+
     def __init__(self,
                  id: int,
-                 team: str,
+                 team: typing.Union[Team, str],
                  position: Position,
                  velocity: Velocity,
                  orientation: Orientation,
@@ -34,27 +76,29 @@ class Player:
 
         Args:
             id: Unique identifier for the player.
-            team: The team the player belongs to (e.g., 'home', 'away').
+            team: The team the player belongs to, as a Team or its name ('home', 'away').
             position: The current position of the player (2D or 3D vector).
+                      Stored as a float32 array of that length, as is velocity.
             velocity: The current velocity of the player (2D or 3D vector).
             orientation: The orientation or facing direction of the player (angle or vector).
             is_controlled_by_ai: True if the player is controlled by AI, False if human/other.
                                  This flag indicates if an AI controller is responsible for this player.
             stamina: The current stamina level (e.g., 0.0 to 1.0).
-            attributes: Dictionary of player attributes (e.g., {'speed': 0.8, 'shooting': 0.7}).
+            attributes: Player attributes, as a dict (e.g., {'speed': 0.8, 'shooting': 0.7})
+                        or a row in ATTR_NAMES order; stored as a float32 row.
             mass: The mass of the player (for physics calculations).
             radius: The radius of the player (for collision detection).
             ai_controller: An optional instance of an AI controller class responsible for this player's decisions.
                            Should be None if is_controlled_by_ai is False.
         """
         self.id: int = id
-        self.team: str = team
-        self.position: Position = position
-        self.velocity: Velocity = velocity
+        self.team: Team = as_team(team)
+        self.position: np.ndarray = np.asarray(position, dtype=np.float32)
+        self.velocity: np.ndarray = np.asarray(velocity, dtype=np.float32)
         self.orientation: Orientation = orientation
         self.is_controlled_by_ai: bool = is_controlled_by_ai
         self.stamina: float = stamina
-        self.attributes: Attributes = attributes
+        self.attributes: np.ndarray = attributes_row(attributes)
         self.mass: float = mass
         self.radius: float = radius
         self.ai_controller: typing.Optional[AIBasePlayer] = ai_controller # Store the AI controller instance
@@ -63,6 +107,8 @@ class Ball:
     """
     Represents the football in the simulation.
     """
+    __slots__ = ('position', 'velocity', 'mass', 'radius')
+
     def __init__(self,
                  position: Position,
                  velocity: Velocity,
@@ -73,12 +119,13 @@ class Ball:
 
         Args:
             position: The current position of the ball (2D or 3D vector).
+                      Stored as a float32 array of that length, as is velocity.
             velocity: The current velocity of the ball (2D or 3D vector).
             mass: The mass of the ball (for physics calculations).
             radius: The radius of the ball (for collision detection).
         """
-        self.position: Position = position
-        self.velocity: Velocity = velocity
+        self.position: np.ndarray = np.asarray(position, dtype=np.float32)
+        self.velocity: np.ndarray = np.asarray(velocity, dtype=np.float32)
         self.mass: float = mass
         self.radius: float = radius
 
@@ -89,10 +136,49 @@ FieldDimensions = typing.Dict[str, typing.Union[float, typing.Tuple[float, float
 # Example TeamSides: {'home': 'left', 'away': 'right'}
 TeamSides = typing.Dict[str, str]
 
+# Read-only copy of the moving parts of a GameState, see GameState.snapshot().
+# positions, radii, ball_position and ball_radius read the same as on a
+# GameState, so array-based AIs (e.g. ai.batch_ai.BallSeekerAI) accept either.
+StateSnapshot = collections.namedtuple(
+    'StateSnapshot', ('game_time', 'positions', 'velocities', 'ball_position', 'ball_velocity',
+                      'radii', 'ball_radius'))
+
+def _frozen_copy(array: np.ndarray) -> np.ndarray:
+    """Returns a copy of `array` that cannot be written to."""
+    array = np.array(array, dtype=np.float32)
+    array.setflags(write=False)
+    return array
+
+# Default length of a match, in seconds of game time
+MATCH_DURATION = 90 * 60.0
+
+# Returned for teams without players; shared, so it must never be mutated
+_NO_PLAYERS: PlayersList = []
+
 class GameState:
     """
     Represents the complete state of the football simulation at a given moment.
+
+    Besides the Player objects, the per-player numeric fields are kept as
+    columns (row i belongs to players[i]) so that physics and AI code can work
+    on all players with array operations. Each player's position and velocity
+    are views of its row of `positions`/`velocities`, so both stay in sync.
+
+    Attributes:
+        positions: (N, D) float32 player positions.
+        velocities: (N, D) float32 player velocities.
+        radii: (N,) float32 player radii.
+        masses: (N,) float32 player masses.
+        attributes: (N, len(ATTR_NAMES)) float32 player attributes, e.g.
+                    attributes[:, ATTR_INDEX['speed']] for every player's speed.
+        ids: (N,) int32 player ids.
+        team_ids: (N,) int8 Team of each player.
     """
+    __slots__ = ('players', 'ball', 'game_time', 'score', 'ball_possession_player_id',
+                 'last_ball_touch_player_id', 'field_dimensions', 'team_sides',
+                 '_id_index', '_team_players', 'positions', 'velocities', 'radii', 'masses', 'ids',
+                 'team_ids', 'attributes', 'match_duration')
+
     def __init__(self,
                  players: PlayersList,
                  ball: Ball,
@@ -101,7 +187,8 @@ class GameState:
                  ball_possession_player_id: typing.Optional[int] = None, # ID of player possessing the ball, or None
                  last_ball_touch_player_id: typing.Optional[int] = None, # ID of player who last touched the ball, or None
                  field_dimensions: typing.Optional[FieldDimensions] = None, # Dimensions of the field
-                 team_sides: typing.Optional[TeamSides] = None # Sides of the field for each team
+                 team_sides: typing.Optional[TeamSides] = None, # Sides of the field for each team
+                 match_duration: float = MATCH_DURATION # Game time at which the match ends
                 ):
         """
         Generates a GameState object.
@@ -117,6 +204,7 @@ class GameState:
                               Required for context and calculations like offside. Can be None if not initialized yet.
             team_sides: Dictionary mapping team names ('home', 'away') to their side of the field ('left', 'right').
                         Required for context and calculations like offside. Can be None if not initialized yet.
+            match_duration: The game time (same unit as game_time) at which the match is over.
         """
         self.players: PlayersList = players
         self.ball: Ball = ball
@@ -126,6 +214,68 @@ class GameState:
         self.last_ball_touch_player_id: typing.Optional[int] = last_ball_touch_player_id
         self.field_dimensions: typing.Optional[FieldDimensions] = field_dimensions
         self.team_sides: typing.Optional[TeamSides] = team_sides
+        self.match_duration: float = match_duration
+        # Lookup tables for the AI-facing queries; kept up to date by add_player
+        self._id_index: typing.Dict[int, int] = {}
+        self._team_players: typing.Dict[Team, PlayersList] = {}
+        self._index_players()
+        self._build_columns()
+
+    def _build_columns(self) -> None:
+        """Builds the per-player columns from the Player objects."""
+        players = self.players
+        dims = len(players[0].position) if players else 2
+        self.radii = np.array([player.radius for player in players], dtype=np.float32)
+        self.masses = np.array([player.mass for player in players], dtype=np.float32)
+        self.ids = np.array([player.id for player in players], dtype=np.int32)
+        self.team_ids = np.array([player.team for player in players], dtype=np.int8)
+        self.attributes = np.array([player.attributes for player in players],
+                                   dtype=np.float32).reshape(-1, len(ATTR_NAMES))
+        for player, attributes in zip(players, self.attributes):
+            player.attributes = attributes
+        self.bind_arrays(
+            np.array([player.position for player in players], dtype=np.float32).reshape(-1, dims),
+            np.array([player.velocity for player in players], dtype=np.float32).reshape(-1, dims),
+        )
+
+    def bind_arrays(self, positions: np.ndarray, velocities: np.ndarray) -> None:
+        """
+        Makes `positions`/`velocities` the storage of the player positions and velocities.
+
+        Used by the simulation to share its physics arrays with the game state:
+        afterwards every update of those arrays shows on the players without copying.
+
+        Args:
+            positions: (N, D) array, row i for players[i].
+            velocities: (N, D) array, row i for players[i].
+        """
+        self.positions = positions
+        self.velocities = velocities
+        for player, position, velocity in zip(self.players, positions, velocities):
+            player.position, player.velocity = position, velocity
+
+    def _index_players(self) -> None:
+        """Rebuilds the id -> list index and the per-team player lists."""
+        self._id_index = {player.id: index for index, player in enumerate(self.players)}
+        self._team_players = {}
+        for player in self.players:
+            self._team_players.setdefault(player.team, []).append(player)
+
+    def add_player(self, player: Player) -> None:
+        """
+        Adds a player to the game.
+
+        Players must be added through this method rather than by appending to
+        `players` directly, so that the lookup tables and columns stay in sync.
+        The columns are reallocated, so views of them taken earlier go stale.
+
+        Args:
+            player: The Player object to add.
+        """
+        self._id_index[player.id] = len(self.players)
+        self.players.append(player)
+        self._team_players.setdefault(player.team, []).append(player)
+        self._build_columns()
 
     def get_player_by_id(self, player_id: int) -> typing.Optional[Player]:
         """
@@ -137,22 +287,75 @@ class GameState:
         Returns:
             The Player object if found, otherwise None.
         """
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        return None
+        index = self._id_index.get(player_id)
+        return None if index is None else self.players[index]
 
-    def get_players_by_team(self, team_name: str) -> PlayersList:
+    def get_players_by_team(self, team_name: typing.Union[Team, str]) -> PlayersList:
         """
         Finds and returns all players belonging to a specific team.
 
         Args:
-            team_name: The name of the team ('home' or 'away').
+            team_name: The Team, or its name ('home' or 'away').
 
         Returns:
-            A list of Player objects belonging to the specified team.
+            A list of Player objects belonging to the specified team. This is
+            the list GameState keeps for the team, not a copy: treat it as
+            read-only and add players through add_player.
+        """
+        return self._team_players.get(as_team(team_name), _NO_PLAYERS)
+
+    def snapshot(self) -> StateSnapshot:
         """
-        return [player for player in self.players if player.team == team_name]
+        Returns a consistent, read-only copy of the positions and velocities.
+
+        Meant for readers on another thread (e.g. an ai.worker.AIWorker-driven
+        planner) while the simulation keeps stepping: the columns are copied
+        with one memcpy each, so the snapshot never changes halfway through a
+        decision, and the arrays are marked read-only.
+        """
+        return StateSnapshot(
+            self.game_time,
+            _frozen_copy(self.positions),
+            _frozen_copy(self.velocities),
+            _frozen_copy(self.ball.position),
+            _frozen_copy(self.ball.velocity),
+            _frozen_copy(self.radii),
+            self.ball.radius,
+        )
+
+    @property
+    def ball_position(self) -> np.ndarray:
+        """The ball position, named as in StateSnapshot."""
+        return self.ball.position
+
+    @property
+    def ball_radius(self) -> float:
+        """The ball radius, named as in StateSnapshot."""
+        return self.ball.radius
+
+    def is_game_over(self) -> bool:
+        """
+        Returns whether the match has ended, i.e. game_time reached match_duration.
+        """
+        return self.game_time >= self.match_duration
+
+    def get_player_indices_near(self, point: Position, radius: float) -> np.ndarray:
+        """
+        Finds the players within `radius` of `point` (e.g. candidate pass targets).
+
+        One vectorized distance test over the positions column; for pairwise
+        queries among all players use simulation.close_pairs instead.
+
+        Args:
+            point: The query position.
+            radius: The search radius.
+
+        Returns:
+            An int array of indices into `players`, in ascending order.
+        """
+        dims = self.positions.shape[1]
+        delta = self.positions - np.asarray(point[:dims], dtype=np.float32)
+        return np.flatnonzero(np.einsum('ij,ij->i', delta, delta) < radius * radius)
 
     def get_player_with_possession(self) -> typing.Optional[Player]:
         """
@@ -176,4 +379,218 @@ class GameState:
             return self.get_player_by_id(self.last_ball_touch_player_id)
         return None
 
-    # Add other utility methods as needed, e.g., for calculating distances, offside, etc.
\ No newline at end of file
+    # Add other utility methods as needed, e.g., for calculating distances, offside, etc.
+
+# {'x': ..., 'y': ...} position, as used by the State API
+PositionDict = typing.Dict[str, float]
+
+# Layout every State starts from unless given one, and the one play restarts
+# from after a goal: ball on the centre spot, one player of each team beside it
+KICKOFF_BALL_POS: PositionDict = {'x': 0.0, 'y': 0.0}
+KICKOFF_PLAYER_POSITIONS: typing.Dict[str, PositionDict] = {
+    'player1_teamA': {'x': -10.0, 'y': 0.0},
+    'player1_teamB': {'x': 10.0, 'y': 0.0},
+}
+
+class _ReadOnlyDict(dict):
+    """A dict whose contents cannot be changed, for views that State shares between readers."""
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Copies and unpickled instances are plain, writable dicts
+        return dict, (dict(self),)
+
+def _position_rows(positions: typing.Iterable[PositionDict], dtype=np.float32) -> np.ndarray:
+    """Converts {'x', 'y'} dicts to an (N, 2) array of `dtype`."""
+    return np.array([(pos['x'], pos['y']) for pos in positions], dtype=dtype).reshape(-1, 2)
+
+# The kickoff layout as a read-only (1 + N, 2) array (ball first), built once;
+# State.reset_positions copies it instead of converting the dicts on every goal
+_KICKOFF_IDS = tuple(KICKOFF_PLAYER_POSITIONS)
+_KICKOFF_INDEX = {player_id: row for row, player_id in enumerate(_KICKOFF_IDS)}
+_KICKOFF_XY = _frozen_copy(_position_rows([KICKOFF_BALL_POS, *KICKOFF_PLAYER_POSITIONS.values()]))
+
+def _reset_layout(player_positions: typing.Dict[str, PositionDict], dtype=np.float32) -> np.ndarray:
+    """
+    The read-only (1 + N, 2) layout State.reset_positions restores: the ball
+    on the centre spot, each player of KICKOFF_PLAYER_POSITIONS on its kickoff
+    spot and every other player on its spot in `player_positions`.
+    """
+    layout = _position_rows([KICKOFF_BALL_POS, *(KICKOFF_PLAYER_POSITIONS.get(player_id, pos)
+                                                 for player_id, pos in player_positions.items())], dtype)
+    layout.setflags(write=False)
+    return layout
+
+# From this many players on, State.update_positions writes all the rows in one
+# indexed assignment; for fewer, one assignment per row is faster
+_SCATTER_MIN_PLAYERS = 40
+
+# Team names used by State, and the Team (row of State's score array) of each
+TEAM_IDX: typing.Dict[str, Team] = {'teamA': Team.HOME, 'teamB': Team.AWAY}
+# Row t is the change of the score array when Team t scores
+_GOAL_DELTA = np.eye(len(TEAM_IDX), dtype=np.int32)
+_GOAL_DELTA.setflags(write=False)
+
+class State:
+    """
+    Compact match state: the ball and player positions and the score.
+
+    All positions live in one contiguous (1 + N, 2) array, float32 unless
+    another dtype is given: row 0 is the ball and row 1 + i the i-th player
+    id, with the ball and player parts used through views of it. The
+    {'x', 'y'} dicts of the public API are only built when
+    ball_position/player_positions are read.
+
+    A state keeps its players for its whole life; see reset_positions for
+    where they stand after a goal.
+    """
+    __slots__ = ('_score', '_xy', '_ball', '_players', '_ids', '_idx', '_player_view', '_reset_xy')
+
+    def __init__(self,
+                 initial_ball_pos: typing.Optional[PositionDict] = None,
+                 initial_player_positions: typing.Optional[typing.Dict[str, PositionDict]] = None,
+                 dtype: np.dtype = np.float32):
+        """
+        Generates a State object.
+
+        Args:
+            initial_ball_pos: Position to start the ball at; KICKOFF_BALL_POS if None.
+            initial_player_positions: {player_id: position} of every player in the
+                                      state; KICKOFF_PLAYER_POSITIONS if None.
+                                      Players not in KICKOFF_PLAYER_POSITIONS also
+                                      restart from these positions after a goal.
+            dtype: Floating point type of the position arrays, e.g. np.float16
+                   to halve their size again for ML agents reading them.
+        """
+        self._score = np.zeros(len(TEAM_IDX), dtype=np.int32) # Goals, indexed by Team
+        self._player_view = None # Built by player_positions, dropped whenever the players move
+        if initial_player_positions is None:
+            self._bind(_KICKOFF_XY.astype(dtype), _KICKOFF_IDS, _KICKOFF_INDEX)
+            self._reset_xy = _KICKOFF_XY
+        else:
+            ids = tuple(initial_player_positions)
+            xy = _position_rows([KICKOFF_BALL_POS, *initial_player_positions.values()], dtype)
+            self._bind(xy, ids, {player_id: row for row, player_id in enumerate(ids)})
+            self._reset_xy = _reset_layout(initial_player_positions, dtype)
+        if initial_ball_pos is not None:
+            self._ball[:] = (initial_ball_pos['x'], initial_ball_pos['y'])
+
+    def _bind(self, xy: np.ndarray, ids: typing.Tuple[str, ...], idx: typing.Dict[str, int]) -> None:
+        """Makes `xy` the position array, for the players `ids` with id -> row map `idx`."""
+        self._xy = xy
+        self._ball = xy[0]
+        self._players = xy[1:]
+        self._ids = ids
+        self._idx = idx
+
+    @property
+    def score(self) -> typing.Dict[str, int]:
+        """The goals of each team, as a new {'teamA': ..., 'teamB': ...} dict."""
+        return {name: int(self._score[team]) for name, team in TEAM_IDX.items()}
+
+    @property
+    def player_ids(self) -> typing.Tuple[str, ...]:
+        """The player ids, in the row order of the player position array."""
+        return self._ids
+
+    @property
+    def ball_position(self) -> PositionDict:
+        """The ball position, as a new {'x', 'y'} dict."""
+        return {'x': float(self._ball[0]), 'y': float(self._ball[1])}
+
+    @property
+    def player_positions(self) -> typing.Dict[str, PositionDict]:
+        """
+        The {player_id: position} of every player, as read-only dicts.
+
+        Built on the first read after the players moved and then returned
+        again on every read until they move, so repeated reads do not copy.
+        """
+        if self._player_view is None:
+            self._player_view = _ReadOnlyDict(
+                (player_id, _ReadOnlyDict(x=x, y=y))
+                for player_id, (x, y) in zip(self._ids, self._players.tolist())
+            )
+        return self._player_view
+
+    def positions_equal(self, other: 'State') -> bool:
+        """True if `other` has the same players at the same positions, ball included."""
+        return self._ids == other._ids and np.array_equal(self._xy, other._xy)
+
+    def update_positions(self, ball_pos: PositionDict, player_positions: typing.Dict[str, PositionDict]) -> None:
+        """
+        Moves the ball and the given players.
+
+        Args:
+            ball_pos: The new ball position.
+            player_positions: {player_id: new position}; may cover only some of
+                              the players, the others keep their positions.
+
+        Raises:
+            KeyError: If a player id is not in the state. Nothing is moved then:
+                      every row is resolved before the first write.
+        """
+        ball_xy = (ball_pos['x'], ball_pos['y'])
+        n = len(player_positions)
+        if n < _SCATTER_MIN_PLAYERS:
+            idx = self._idx
+            updates = [(idx[player_id], (pos['x'], pos['y'])) for player_id, pos in player_positions.items()]
+            self._ball[:] = ball_xy
+            self._player_view = None
+            for row, xy in updates:
+                self._players[row] = xy
+            return
+        # Read into a row index array and a coordinate array once, then write
+        # all the rows with a single indexed assignment
+        rows = np.fromiter(map(self._idx.__getitem__, player_positions), dtype=np.intp, count=n)
+        xy = np.fromiter((c for pos in player_positions.values() for c in (pos['x'], pos['y'])),
+                         dtype=self._players.dtype, count=2 * n)
+        self._ball[:] = ball_xy
+        self._player_view = None
+        self._players[rows] = xy.reshape(n, 2)
+
+    def update_positions_arr(self, ball_xy: np.ndarray, player_xy: np.ndarray) -> None:
+        """
+        Moves the ball and every player, copying into the existing arrays.
+
+        For game loops that already hold positions as arrays; skips the dicts
+        of update_positions entirely.
+
+        Args:
+            ball_xy: (2,) new ball position.
+            player_xy: (N, 2) new player positions, row i for player_ids[i].
+        """
+        np.copyto(self._ball, ball_xy)
+        np.copyto(self._players, player_xy)
+        self._player_view = None
+
+    def reset_positions(self) -> None:
+        """
+        Puts the ball on the centre spot and the players on their restart spots.
+
+        The players are never replaced. Each player whose id is in
+        KICKOFF_PLAYER_POSITIONS restarts from its kickoff spot, any other
+        player from the position it was created with. The layout is built
+        once, when the State is created.
+        """
+        self._player_view = None
+        np.copyto(self._xy, self._reset_xy) # One copy for the ball and all players
+
+    def handle_goal(self, team: str) -> None:
+        """
+        Counts a goal for `team` and restarts play from the kickoff layout.
+
+        Args:
+            team: The scoring team, 'teamA' or 'teamB'.
+
+        Raises:
+            KeyError: If `team` is not one of the two teams.
+        """
+        self._score += _GOAL_DELTA[TEAM_IDX[team]]
+        self.reset_positions()
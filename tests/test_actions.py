@@ -0,0 +1,76 @@
+import pytest
+
+import numpy as np
+
+from src.zzocker import actions
+
+
+def test_action_batch_set_get_round_trip():
+    """Tests that every action type written with set() is read back by get()."""
+    batch = actions.ActionBatch(5)
+    batch.set(0, actions.MoveAction((3, 4)))
+    batch.set(1, actions.PassAction(target_player_id=7))
+    batch.set(2, actions.ShootAction(target_position=(100, 50)))
+    batch.set(3, actions.TackleAction(target_player_id=2))
+
+    assert batch.kinds.tolist() == [actions.MOVE, actions.PASS, actions.SHOOT, actions.TACKLE, actions.NO_ACTION]
+    assert batch.get(0).target_position == (3, 4)
+    assert batch.get(1).target_player_id == 7
+    assert batch.get(2).target_position == (100, 50)
+    assert batch.get(3).target_player_id == 2
+    assert batch.get(4) is None
+
+
+def test_action_batch_set_rejects_unknown_actions():
+    """Tests that set() raises TypeError for objects that are not a supported Action."""
+    batch = actions.ActionBatch(1)
+    with pytest.raises(TypeError):
+        batch.set(0, object())
+
+
+def test_action_batch_lanes_share_arrays_and_clear_resets():
+    """Tests that lanes() are views of the parent batch and clear() idles every player."""
+    batch = actions.ActionBatch(4)
+    team2 = batch.lanes(2, 4)
+    team2.set(0, actions.PassAction(target_player_id=1))
+    team2.set(1, actions.MoveAction((9, 9)))
+
+    assert batch.kinds.tolist() == [actions.NO_ACTION, actions.NO_ACTION, actions.PASS, actions.MOVE]
+    assert batch.target_id[2] == 1
+    assert batch.target_xy[3].tolist() == [9, 9]
+
+    batch.clear()
+    assert (team2.kinds == actions.NO_ACTION).all()
+    assert (batch.target_id == -1).all()
+
+
+def test_apply_moves_only_moves_move_lanes():
+    """Tests that apply_moves writes the targets of MOVE lanes and leaves the other rows alone."""
+    pos = np.array([[1.0, 1.0], [2.0, 2.0], [3.0, 3.0]], dtype=np.float32)
+    batch = actions.ActionBatch(3)
+    batch.set(0, actions.MoveAction((10, 20)))
+    batch.set(1, actions.ShootAction(target_goal_id=2))
+    batch.target_xy[2] = (50, 50) # Stale target of an idle player
+
+    actions.apply_moves(pos, batch)
+
+    assert pos.tolist() == [[10.0, 20.0], [2.0, 2.0], [3.0, 3.0]]
+
+
+def test_event_log_records_grows_and_clears():
+    """Tests that EventLog keeps every event across buffer growth and clear() empties it."""
+    log = actions.EventLog(capacity=2)
+    for step in range(5): # Past the capacity: the buffer doubles twice
+        log.record(step, 10 + step, actions.SHOOT, 1)
+
+    assert len(log) == 5
+    assert log.events['step'].tolist() == [0, 1, 2, 3, 4]
+    assert log.events['actor_id'].tolist() == [10, 11, 12, 13, 14]
+    assert (log.events['action_type'] == actions.SHOOT).all()
+    assert (log.events['outcome_code'] == 1).all()
+
+    log.clear()
+    assert len(log) == 0
+    assert log.events.size == 0
+    log.record(7, 1, actions.TACKLE)
+    assert log.events.tolist() == [(7, 1, actions.TACKLE, 0)]
@@ -0,0 +1,18 @@
+import pytest
+
+import numpy as np
+
+from src.zzocker.ai import batch_ai
+
+
+def test_compute_all_actions_points_at_ball_and_flags_kicks():
+    """Tests the vectorized seek decisions against the per-player formula."""
+    pos = np.array([[0.0, 0.0], [100.0, 0.0], [103.0, 0.0]], dtype=np.float32)
+    radii = np.array([5.0, 5.0, 5.0], dtype=np.float32)
+
+    move_dirs, kick = batch_ai.compute_all_actions(pos, (100.0, 0.0), radii, 3.0)
+
+    assert move_dirs[0].tolist() == pytest.approx([1.0, 0.0])
+    assert move_dirs[1].tolist() == [0.0, 0.0] # Already on the ball
+    assert move_dirs[2].tolist() == pytest.approx([-1.0, 0.0])
+    assert kick.tolist() == [False, True, True]
@@ -1,6 +1,11 @@
 import pytest
 import math
 
+import numpy as np
+
+from src.zzocker import physics as soa_physics
+
+
 # Assume src.zzocker.physics exists and contains necessary classes/functions
 # like Vector2D, distance, check_collision, apply_force, update_position.
 # If Vector2D is not in physics, assume it's a dependency like from a 'utils' module.
@@ -10,6 +15,8 @@ import math
 # objects with specific attributes like position, velocity, mass, radius.
 
 class MockVector2D:
+    __slots__ = ('x', 'y')
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -46,10 +53,13 @@ class MockVector2D:
         return f"MockVector2D({self.x}, {self.y})"
 
 class MockPhysicsObject:
+    __slots__ = ('position', 'velocity', 'mass', 'inv_mass', 'radius', 'acceleration')
+
     def __init__(self, position, velocity, mass, radius):
         self.position = position # Expected to be a Vector2D-like object
         self.velocity = velocity # Expected to be a Vector2D-like object
         self.mass = mass
+        self.inv_mass = 1.0 / mass if mass > 0 else 0.0 # 0 for massless objects, which forces do not move
         self.radius = radius
         self.acceleration = MockVector2D(0, 0) # Assuming physics might use acceleration
 
@@ -65,20 +75,27 @@ def mock_distance(pos1, pos2):
 
 def mock_check_collision(obj1, obj2):
     """Checks for collision between two circular objects."""
-    dist = mock_distance(obj1.position, obj2.position)
-    return dist < (obj1.radius + obj2.radius)
+    r = obj1.radius + obj2.radius
+    # Most pairs are rejected on a single axis, before any multiplication
+    dx = abs(obj1.position.x - obj2.position.x)
+    if dx >= r:
+        return False
+    dy = abs(obj1.position.y - obj2.position.y)
+    if dy >= r:
+        return False
+    # Compared squared, so no square root is needed
+    return dx*dx + dy*dy < r*r
 
 def mock_apply_force(obj, force_vector, delta_time):
     """Applies a force to an object, updating its velocity based on mass."""
     # F = ma => a = F/m
-    if obj.mass <= 0:
+    if obj.inv_mass == 0.0:
         return # Cannot apply force to massless object
 
     # Assuming force_vector is a Vector2D-like object
-    acceleration_change = force_vector / obj.mass
     # Assuming velocity is updated based on acceleration over time
     # This is a simplified integration (Euler method)
-    obj.velocity = obj.velocity + acceleration_change * delta_time
+    obj.velocity = obj.velocity + force_vector * (obj.inv_mass * delta_time)
 
 
 def mock_update_position(obj, delta_time):
@@ -99,6 +116,8 @@ try:
     update_position = getattr(physics, 'update_position', mock_update_position)
     # Adapt MockPhysicsObject to use the actual Vector2D if needed
     class TestPhysicsObject(MockPhysicsObject):
+         __slots__ = ()
+
          def __init__(self, position, velocity, mass, radius):
              super().__init__(
                  Vector2D(position.x, position.y) if isinstance(position, MockVector2D) else Vector2D(position[0], position[1]),
@@ -343,48 +362,39 @@ def mock_resolve_collision(obj1, obj2, restitution=1.0):
     This is a simplified 1D collision along the line connecting centers.
     Real 2D collision resolution is more complex.
     """
-    # Vector connecting centers
+    # Vector connecting centers (not normalized yet)
     normal = obj2.position - obj1.position
-    dist = normal.magnitude()
-
-    if dist == 0:
-        # Objects are at the same position, handle appropriately (e.g., separate them)
-        # For test simplicity, let's just return or apply a default separation force
-        # In a real engine, you'd need to move them apart first.
-        # Let's just exit for this simplified test mock.
-        return
-
-    # Normalize collision normal
-    normal = normal.normalize()
 
     # Relative velocity
     relative_velocity = obj1.velocity - obj2.velocity
 
-    # Relative velocity along the normal
-    # vn = relative_velocity . normal (dot product)
-    vn = relative_velocity.x * normal.x + relative_velocity.y * normal.y
+    # Relative velocity along the normal, scaled by the distance
+    # The normal points from obj1 to obj2, so vn > 0 means they are approaching
+    vn_unnorm = relative_velocity.x * normal.x + relative_velocity.y * normal.y
 
-    # If objects are moving apart, no impulse needed (unless interpenetration occurred)
-    if vn > 0:
+    # Objects moving apart, or at the same position (normal (0, 0)), need no
+    # impulse; checked before the sqrt, which most such pairs then skip
+    # (in a real engine, objects at the same position would be separated)
+    if vn_unnorm <= 0:
         return
 
+    # Normalize collision normal
+    inv_dist = 1.0 / math.sqrt(normal.x * normal.x + normal.y * normal.y)
+    vn = vn_unnorm * inv_dist
+
     # Calculate impulse scalar using conservation of momentum and restitution
     # impulse = -(1 + e) * vn / (1/m1 + 1/m2)
-    m1_inv = 1.0 / obj1.mass if obj1.mass > 0 else 0
-    m2_inv = 1.0 / obj2.mass if obj2.mass > 0 else 0
-
-    if m1_inv + m2_inv == 0:
-        return # Both objects are infinite mass (immovable)
-
-    impulse_scalar = -(1 + restitution) * vn / (m1_inv + m2_inv)
+    # For two immovable objects (1/m1 + 1/m2 == 0) the impulse is scaled by 0
+    m1_inv = obj1.inv_mass
+    m2_inv = obj2.inv_mass
+    impulse_scalar = -(1 + restitution) * vn / (m1_inv + m2_inv + 1e-30)
 
     # Apply impulse
-    impulse = normal * impulse_scalar
+    impulse = normal * (impulse_scalar * inv_dist)
 
-    if obj1.mass > 0:
-        obj1.velocity = obj1.velocity + impulse / obj1.mass
-    if obj2.mass > 0:
-        obj2.velocity = obj2.velocity - impulse / obj2.mass # Impulse is opposite for obj2
+    # Scaled by the inverse masses, so massless objects are left as they are
+    obj1.velocity = obj1.velocity + impulse * m1_inv
+    obj2.velocity = obj2.velocity - impulse * m2_inv # Impulse is opposite for obj2
 
 # Use the actual collision resolution if available
 try:
@@ -481,4 +491,176 @@ def test_collision_resolution():
     # Total mass = 2
     # Final velocity = (1,0) / 2 = (0.5, 0)
     assert obj9.velocity.x == pytest.approx(0.5)
-    assert obj9.velocity.y == pytest.approx(0.0)
\ No newline at end of file
+    assert obj9.velocity.y == pytest.approx(0.0)
+
+def test_update_physics_soa_damping_and_boundaries():
+    """Tests the vectorized update_physics on the SoA physics State."""
+    entities = [
+        soa_physics.Entity('ball', (795, 300), (60, 0), radius=10), # Heading into the right wall
+        soa_physics.Entity('player', (100, 300), (10, 0), radius=15),
+    ]
+    state = soa_physics.State(entities)
+    dt = 0.1
+
+    soa_physics.update_physics(state, dt)
+
+    min_x, max_x, min_y, max_y = soa_physics.FIELD_BOUNDARIES
+    # Ball: damped, moved past the wall, clamped back inside and reflected
+    assert state.pos[0, 0] == pytest.approx(max_x - 10)
+    assert state.vel[0, 0] == pytest.approx(-60 * soa_physics.BALL_DAMPING)
+    assert state.pos[0, 1] == pytest.approx(300)
+    # Player: damped and moved, players do not bounce
+    assert state.vel[1, 0] == pytest.approx(10 * soa_physics.PLAYER_DAMPING)
+    assert state.pos[1, 0] == pytest.approx(100 + 10 * soa_physics.PLAYER_DAMPING * dt)
+
+
+def test_update_physics_kernel_matches_numpy_path():
+    """Tests the compiled physics kernel against the NumPy helpers."""
+    if soa_physics._update_physics_kernel is None:
+        pytest.skip("Numba is not installed")
+
+    jit_state = soa_physics.State()
+    ref_state = soa_physics.State()
+    jit_state.vel[0] = ref_state.vel[0] = (400, 250) # Bounce the ball off several walls
+    dt = 1 / 60.0
+    for _ in range(200):
+        soa_physics.update_physics(jit_state, dt)
+        soa_physics.apply_damping(ref_state.vel, ref_state.damping)
+        soa_physics.update_movement(ref_state.pos, ref_state.vel, dt)
+        soa_physics.reflect_bounds(ref_state.pos, ref_state.vel, ref_state.radius, ref_state.is_ball)
+
+    assert jit_state.pos.ravel().tolist() == pytest.approx(ref_state.pos.ravel().tolist(), rel=1e-4)
+    assert jit_state.vel.ravel().tolist() == pytest.approx(ref_state.vel.ravel().tolist(), rel=1e-4)
+
+
+def test_parallel_kernel_matches_serial_kernel():
+    """Tests the prange physics kernel against the serial one on a large entity count."""
+    if soa_physics._update_physics_kernel is None:
+        pytest.skip("Numba is not installed")
+
+    entities = [soa_physics.Entity('ball' if i % 7 == 0 else 'player',
+                                   (i % 800, (i * 13) % 600), ((i % 11) * 40 - 200, (i % 5) * 60 - 120),
+                                   radius=10)
+                for i in range(soa_physics.PARALLEL_MIN_ENTITIES)]
+    serial_state = soa_physics.State(entities)
+    parallel_state = soa_physics.State(entities)
+    for _ in range(10):
+        soa_physics._update_physics_kernel(serial_state.pos, serial_state.vel, serial_state.radius,
+                                           serial_state.damping, serial_state.is_ball, 0.1,
+                                           *soa_physics.FIELD_BOUNDARIES)
+        soa_physics.update_physics(parallel_state, 0.1) # Dispatches to the parallel kernel
+
+    assert (serial_state.pos == parallel_state.pos).all()
+    assert (serial_state.vel == parallel_state.vel).all()
+
+
+def test_batched_state_matches_single_state():
+    """Tests that a batched physics State advances each game like an unbatched one."""
+    single = soa_physics.State()
+    batched = soa_physics.State(batch_size=4)
+    assert batched.pos.shape == (4,) + single.pos.shape
+
+    for _ in range(120):
+        soa_physics.update_physics(single, 1 / 60.0)
+        soa_physics.update_physics(batched, 1 / 60.0)
+
+    for game in range(4):
+        assert batched.pos[game].ravel().tolist() == pytest.approx(single.pos.ravel().tolist())
+        assert batched.vel[game].ravel().tolist() == pytest.approx(single.vel.ravel().tolist())
+
+    # Only the games flagged as done are restored to their initial layout
+    fresh = soa_physics.State()
+    batched.reset([True, False, True, False])
+    assert batched.pos[0].ravel().tolist() == fresh.pos.ravel().tolist()
+    assert batched.pos[2].ravel().tolist() == fresh.pos.ravel().tolist()
+    assert batched.pos[1].ravel().tolist() == pytest.approx(single.pos.ravel().tolist())
+
+def test_entity_views_write_through_to_state():
+    """Tests that State.entities exposes rows of the SoA arrays without copying them."""
+    game_state = soa_physics.State()
+    ball = game_state.entities[0]
+    assert ball.entity_type == 'ball'
+    assert ball.damping_factor == pytest.approx(soa_physics.BALL_DAMPING)
+
+    ball.velocity = (200, 50)
+    assert game_state.vel[0].tolist() == [200, 50]
+    soa_physics.update_physics(game_state, 1 / 60.0)
+    assert ball.position.tolist() == game_state.pos[0].tolist()
+
+def test_state_snapshot_restore_rewinds_in_place():
+    """Tests that State.restore brings back the arrays captured by State.snapshot."""
+    game_state = soa_physics.State()
+    pos, vel = game_state.pos, game_state.vel
+    snapshot = game_state.snapshot()
+    for _ in range(10):
+        soa_physics.update_physics(game_state, 1 / 60.0)
+    assert game_state.pos.tolist() != snapshot[0].tolist()
+
+    game_state.restore(snapshot)
+    assert game_state.pos is pos and game_state.vel is vel
+    assert game_state.pos.tolist() == snapshot[0].tolist()
+    assert game_state.vel.tolist() == snapshot[1].tolist()
+
+def test_close_pairs_kernel_matches_brute_force():
+    """Tests the compiled grid pair search against checking every pair."""
+    if soa_physics.close_pairs_kernel is None:
+        pytest.skip("Numba is not installed")
+    pos = np.random.default_rng(0).uniform(-50, 300, (200, 2)).astype(np.float32)
+    max_dist = np.float32(30)
+
+    pairs = soa_physics.close_pairs_kernel(pos, max_dist)
+
+    expected = set()
+    for i in range(len(pos)):
+        for j in range(i + 1, len(pos)):
+            d = pos[j] - pos[i]
+            if d[0] * d[0] + d[1] * d[1] < max_dist * max_dist:
+                expected.add((i, j))
+    assert len(pairs) == len(expected)
+    assert set(map(tuple, pairs.tolist())) == expected
+
+def test_overlaps_matches_pairwise_check_collision():
+    """Tests the broadcast overlap matrix against check_collision on every pair."""
+    rng = np.random.default_rng(1)
+    pos = rng.uniform(0, 40, (30, 2)).astype(np.float32)
+    radius = rng.uniform(0.5, 3, 30).astype(np.float32)
+
+    hit = soa_physics.overlaps(pos, radius)
+    assert (soa_physics.overlaps(pos, radius, soa_physics.contact_distances_sq(radius)) == hit).all()
+
+    objects = [PhysicsObject(Vector2D(*p), Vector2D(0, 0), 1, r) for p, r in zip(pos.tolist(), radius.tolist())]
+    for i, a in enumerate(objects):
+        for j, b in enumerate(objects):
+            assert hit[i, j] == (i != j and check_collision(a, b))
+
+def test_overlapping_pairs_grid_matches_dense_overlaps():
+    """Tests the grid broad phase against the dense overlap matrix."""
+    rng = np.random.default_rng(2)
+    n = 4 * soa_physics.GRID_MIN_ENTITIES
+    pos = rng.uniform(0, 200, (n, 2)).astype(np.float32)
+    radius = rng.uniform(1, 6, n).astype(np.float32)
+
+    pairs = soa_physics.overlapping_pairs(pos, radius)
+
+    i, j = np.nonzero(np.triu(soa_physics.overlaps(pos, radius)))
+    assert len(pairs) == len(i) > 0
+    assert set(map(tuple, pairs.tolist())) == set(zip(i.tolist(), j.tolist()))
+
+def test_resolve_collisions_matches_resolve_collision_per_pair():
+    """Tests the batched collision impulses against resolve_collision on each pair."""
+    pos = np.array([(-0.4, 0), (0.4, 0), (-1, 5), (0.4, 5.3), (10, 0), (11, 1)], dtype=np.float32)
+    vel = np.array([(1, 0), (-1, 0), (1, 0.5), (0, 0), (0, 0), (-1, -1)], dtype=np.float32)
+    mass = np.array([1, 1, 1, 10, 2, 0]) # The last entity is immovable
+    inv_mass = np.where(mass > 0, 1 / np.maximum(mass, 1), 0).astype(np.float32)
+    pairs = np.array([(0, 1), (2, 3), (4, 5)], dtype=np.int32)
+
+    objects = [PhysicsObject(Vector2D(*p), Vector2D(*v), m, 0.5)
+               for p, v, m in zip(pos.tolist(), vel.tolist(), mass.tolist())]
+    soa_physics.resolve_collisions(pos, vel, inv_mass, pairs, restitution=0.5)
+
+    for i, j in pairs.tolist():
+        resolve_collision(objects[i], objects[j], restitution=0.5)
+    expected = [(obj.velocity.x, obj.velocity.y) for obj in objects]
+    assert vel.ravel().tolist() == pytest.approx(np.ravel(expected).tolist(), abs=1e-6)
+    assert vel[5].tolist() == [-1, -1]
+    assert vel[4].tolist() != [0, 0]
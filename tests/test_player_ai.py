@@ -0,0 +1,49 @@
+import pytest
+
+from src.zzocker import actions
+from src.zzocker import simulation
+from src.zzocker.ai import player_ai
+
+
+class CountingAI(player_ai.AIBasePlayer):
+    """Holds its position and counts how often it had to decide."""
+
+    def __init__(self, player_id):
+        super().__init__(player_id)
+        self.calls = 0
+
+    def decide_action(self, game_state):
+        self.calls += 1
+        player = game_state.get_player_by_id(self.player_id)
+        return actions.MoveAction(tuple(int(v) for v in player.position[:2]))
+
+
+def test_get_action_reuses_decision_until_key_changes():
+    """Tests that a cache hit in get_action skips decide_action."""
+    game_state = simulation.kickoff_game_state(players_per_team=1)
+    ai = CountingAI(game_state.players[0].id)
+
+    first = ai.get_action(game_state)
+    assert ai.get_action(game_state) is first
+    assert ai.calls == 1
+
+    game_state.positions[0, 0] += 2 * player_ai.DECISION_BUCKET_SIZE
+    assert ai.get_action(game_state) is not first
+    assert ai.calls == 2
+
+
+def test_player_ai_team_drives_simulation_through_the_cache():
+    """Tests PlayerAITeam as a SimulationManager team AI: still players decide only once."""
+    game_state = simulation.kickoff_game_state(players_per_team=2)
+    home = [CountingAI(player.id) for player in game_state.players[:2]]
+    away = [CountingAI(player.id) for player in game_state.players[2:]]
+    sim = simulation.SimulationManager(player_ai.PlayerAITeam(home), player_ai.PlayerAITeam(away),
+                                       game_state=game_state)
+    start = game_state.positions.copy()
+
+    sim._is_running = True
+    for _ in range(5):
+        assert sim.step()
+
+    assert [ai.calls for ai in home + away] == [1, 1, 1, 1]
+    assert game_state.positions.tolist() == start.tolist()
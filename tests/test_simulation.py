@@ -0,0 +1,142 @@
+import functools
+import pytest
+
+import numpy as np
+
+from src.zzocker import actions
+from src.zzocker import simulation
+from src.zzocker import state
+from src.zzocker.ai import batch_ai
+import run_simulation
+
+
+def _make_game_state(players_per_team=2, match_duration=90 * 60.0):
+    """A small real GameState: home players on the left, away on the right, ball at the centre."""
+    players = [
+        state.Player(id=team_index * players_per_team + i, team=team,
+                     position=(100.0 + 600.0 * team_index, 150.0 + 100.0 * i), velocity=(0.0, 0.0),
+                     orientation=0.0, is_controlled_by_ai=True, stamina=1.0, attributes={},
+                     mass=70.0, radius=5.0)
+        for team_index, team in enumerate(('home', 'away'))
+        for i in range(players_per_team)
+    ]
+    ball = state.Ball(position=(400.0, 300.0), velocity=(0.0, 0.0), mass=0.45, radius=3.0)
+    return state.GameState(players, ball, match_duration=match_duration)
+
+
+def test_step_runs_ball_seekers_for_n_ticks():
+    """Tests stepping a real GameState driven by one BallSeekerAI per team."""
+    game_state = _make_game_state()
+    sim = simulation.SimulationManager(batch_ai.BallSeekerAI(), batch_ai.BallSeekerAI(), game_state=game_state)
+    ball = game_state.ball.position.copy()
+    start_dist = np.linalg.norm(game_state.positions - ball, axis=1)
+
+    sim._is_running = True
+    n_ticks = 10
+    for _ in range(n_ticks):
+        assert sim.step()
+
+    assert game_state.game_time == pytest.approx(n_ticks * sim.timestep)
+    assert not game_state.is_game_over()
+    # Every player has closed in on the ball, which nobody could reach yet
+    dist = np.linalg.norm(game_state.positions - ball, axis=1)
+    assert (dist < start_dist).all()
+    assert game_state.ball.position.tolist() == ball.tolist()
+
+
+def test_run_stops_at_match_duration():
+    """Tests that run() returns once the game time reaches the match duration."""
+    ai = batch_ai.BallSeekerAI()
+    sim = simulation.SimulationManager(ai, ai, game_state=_make_game_state(match_duration=0.5))
+
+    sim.run()
+
+    assert sim.game_state.is_game_over()
+    assert sim.game_state.game_time < 0.5 + sim.timestep
+    assert not sim.step()
+
+
+def test_run_many_plays_every_game():
+    """Tests run_many with a tiny roster and short matches in worker processes."""
+    factory = functools.partial(simulation.kickoff_game_state, players_per_team=1, match_duration=0.25)
+
+    results = simulation.SimulationManager.run_many(
+        batch_ai.BallSeekerAI, batch_ai.BallSeekerAI, n_games=2, workers=2,
+        game_state_factory=factory, seed=7)
+
+    assert sorted(seed for seed, _ in results) == [7, 8]
+    for _, score in results:
+        assert len(score) == 2 and all(goals >= 0 for goals in score)
+
+
+def test_kickoff_game_state_orders_home_players_first():
+    """Tests the default kick-off layout used by SimulationManager and run_many."""
+    game_state = simulation.kickoff_game_state(players_per_team=3)
+
+    assert game_state.team_ids.tolist() == [0, 0, 0, 1, 1, 1]
+    assert (game_state.positions[:3, 0] < game_state.ball.position[0]).all()
+    assert (game_state.positions[3:, 0] > game_state.ball.position[0]).all()
+    ai = batch_ai.BallSeekerAI()
+    assert len(simulation.SimulationManager(ai, ai).game_state.players) == 22
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["kernel", "python-grid"])
+def test_close_pairs_matches_brute_force(monkeypatch, compiled):
+    """Tests close_pairs, compiled and pure Python, against checking every pair."""
+    if not compiled:
+        monkeypatch.setattr(simulation.physics, "close_pairs_kernel", None)
+    elif simulation.physics.close_pairs_kernel is None:
+        pytest.skip("numba is not installed")
+    rng = np.random.default_rng(3)
+    positions = rng.uniform(0.0, 200.0, size=(60, 2)).astype(np.float32)
+    max_dist = 30.0
+
+    pairs = simulation.close_pairs(positions, max_dist)
+
+    delta = positions[:, None, :] - positions[None, :, :]
+    close = np.einsum('ijk,ijk->ij', delta, delta) < np.float32(max_dist * max_dist)
+    expected = {(i, j) for i, j in zip(*np.nonzero(np.triu(close, k=1)))}
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == expected
+    assert all(i < j for i, j in pairs)
+
+
+def test_tackle_out_of_range_fails():
+    """Tests that only a tackle on an opponent in TACKLE_RANGE is attempted."""
+    ai = batch_ai.BallSeekerAI()
+    sim = simulation.SimulationManager(ai, ai, game_state=simulation.kickoff_game_state(players_per_team=1))
+    sim._player_pos[1] = sim._player_pos[0] + (simulation.TACKLE_RANGE / 2, 0.0)
+    batch = actions.ActionBatch(2)
+    batch.set(0, actions.TackleAction(target_player_id=1))
+
+    (_, in_range), = sim._apply_actions(batch)
+    sim._player_pos[1] = sim._player_pos[0] + (2 * simulation.TACKLE_RANGE, 0.0)
+    (_, out_of_range), = sim._apply_actions(batch)
+
+    assert in_range.data["outcome"] in actions.TACKLE_OUTCOMES
+    assert not out_of_range.success
+    assert out_of_range.data["outcome"] == "failure"
+
+
+def test_run_simulation_entry_point_runs_to_completion(capsys):
+    """Tests the default path of run_simulation.py on a short game."""
+
+    run_simulation.run_game(num_steps=20)
+
+    assert "Simulation finished after" in capsys.readouterr().out
+
+
+def test_events_are_only_recorded_when_asked_for():
+    """Tests that SimulationManager keeps an EventLog only with record_events."""
+    ai = batch_ai.BallSeekerAI()
+    batch = actions.ActionBatch(2)
+    batch.set(0, actions.ShootAction(target_goal_id=2))
+
+    quiet = simulation.SimulationManager(ai, ai, game_state=simulation.kickoff_game_state(players_per_team=1))
+    quiet._apply_actions(batch)
+    assert quiet.events is None
+
+    recording = simulation.SimulationManager(ai, ai, game_state=simulation.kickoff_game_state(players_per_team=1),
+                                             record_events=True)
+    recording._apply_actions(batch)
+    assert recording.events.events[['actor_id', 'action_type']].tolist() == [(0, actions.SHOOT)]
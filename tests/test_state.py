@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from src.zzocker.state import State
 
@@ -14,6 +15,12 @@ INITIAL_PLAYER_POSITIONS = {
 # Assuming goal positions are defined elsewhere or implicitly handled
 # For testing goals, we might simulate the ball being in a goal area.
 
+@pytest.fixture(scope="session")
+def reset_reference():
+    """A State in the kickoff layout the kickoff players reset to after a goal; only read, never modified."""
+    return State()
+
+
 def test_initial_state():
     """Test that the State object is initialized correctly."""
     state = State()
@@ -129,12 +136,9 @@ def test_update_positions():
     assert state.player_positions == updated_player_positions
 
 
-def test_goal_scoring():
+def test_goal_scoring(reset_reference):
     """Test that scoring a goal updates the score and resets the state."""
-    state = State()
-
-    # Assume initial score is 0-0
-    assert state.score == {'teamA': 0, 'teamB': 0}
+    # The initial 0-0 score is checked by test_initial_state
 
     # Simulate a goal for teamA
     # This requires a method in State to handle goals or detect them.
@@ -189,12 +193,10 @@ def test_goal_scoring():
     # Let's assume State has a method `get_initial_positions()` or similar, or that
     # the reset positions are the same as the state right after `State()` is called.
 
-    # Re-initialize a reference state to compare against the reset state
-    reset_state_reference = State() # This represents the state after a reset
+    # The reset_reference fixture (a State()) represents the state after a reset
 
     # Now check the state after the goal against the reference reset state
-    assert state.ball_position == reset_state_reference.ball_position
-    assert state.player_positions == reset_state_reference.player_positions
+    assert state.positions_equal(reset_reference)
 
     # Test scoring for the other team
     state.handle_goal('teamB')
@@ -202,9 +204,7 @@ def test_goal_scoring():
     assert state.score['teamB'] == initial_score['teamB'] + 1 # Score for B increases
 
     # Check positions reset again after the second goal
-    reset_state_reference_after_second_goal = State() # Should be the same reset state
-    assert state.ball_position == reset_state_reference_after_second_goal.ball_position
-    assert state.player_positions == reset_state_reference_after_second_goal.player_positions
+    assert state.positions_equal(reset_reference) # Should be the same reset state
 
 # Add more tests as needed, e.g.:
 # - test_invalid_team_goal
@@ -213,4 +213,119 @@ def test_goal_scoring():
 # - test_state_representation (e.g., __str__ or __repr__)
 # - test_collision_handling side effects on state (if State is involved)
 # - test_time_update (if State tracks time)
-# - test_game_end (if State tracks game end conditions)
\ No newline at end of file
+# - test_game_end (if State tracks game end conditions)
+
+def test_update_positions_arr_matches_update_positions():
+    """Test that the array update moves the same players as the dict one."""
+    state = State(initial_ball_pos=INITIAL_BALL_POS.copy(),
+                  initial_player_positions=INITIAL_PLAYER_POSITIONS.copy())
+    reference = State(initial_ball_pos=INITIAL_BALL_POS.copy(),
+                      initial_player_positions=INITIAL_PLAYER_POSITIONS.copy())
+    new_positions = {player_id: {'x': pos['x'] + 1.0, 'y': pos['y'] - 2.0}
+                     for player_id, pos in INITIAL_PLAYER_POSITIONS.items()}
+
+    reference.update_positions({'x': 3.0, 'y': 4.0}, new_positions)
+    state.update_positions_arr(np.array([3.0, 4.0]),
+                               np.array([[new_positions[player_id]['x'], new_positions[player_id]['y']]
+                                         for player_id in state.player_ids]))
+
+    assert state.positions_equal(reference)
+    assert state.player_positions == new_positions
+
+
+@pytest.mark.parametrize("team,expected", [('teamA', {'teamA': 1, 'teamB': 0}),
+                                           ('teamB', {'teamA': 0, 'teamB': 1})])
+def test_goal_counts_for_scoring_team_and_resets(team, expected):
+    """Test that a goal is counted for the scoring team only and resets the positions."""
+    state = State(initial_ball_pos={'x': 10, 'y': 10},
+                  initial_player_positions=INITIAL_PLAYER_POSITIONS.copy())
+    # player1_* restart at their kickoff spots (their initial ones here), player2_* at
+    # their initial spots, the ball on the centre spot
+    reset_reference = State(initial_player_positions=INITIAL_PLAYER_POSITIONS.copy())
+
+    state.update_positions({'x': 5, 'y': 5}, {player_id: {'x': 1, 'y': 1} for player_id in state.player_ids})
+    state.handle_goal(team)
+
+    assert state.score == expected
+    assert state.positions_equal(reset_reference)
+    assert state.player_positions == INITIAL_PLAYER_POSITIONS
+
+
+def test_goal_resets_kickoff_players_in_any_order(reset_reference):
+    """Test that the kickoff players restart from the kickoff layout even when listed in another order."""
+    state = State(initial_player_positions={
+        'player1_teamB': {'x': 20, 'y': -20},
+        'player1_teamA': {'x': -20, 'y': 20},
+    })
+
+    state.handle_goal('teamB')
+
+    assert state.player_ids == ('player1_teamB', 'player1_teamA')
+    assert state.player_positions == reset_reference.player_positions
+    assert state.ball_position == reset_reference.ball_position
+
+
+
+def test_goal_resets_mixed_roster_per_player():
+    """Test that kickoff players restart at their kickoff spots and the others at their initial spots."""
+    state = State(initial_player_positions={
+        'player1_teamA': {'x': -20, 'y': 20},
+        'substitute': {'x': 30, 'y': 30},
+        'player1_teamB': {'x': 20, 'y': -20},
+    })
+    state.update_positions({'x': 5, 'y': 5}, {player_id: {'x': 1, 'y': 1} for player_id in state.player_ids})
+
+    state.handle_goal('teamA')
+
+    assert state.player_ids == ('player1_teamA', 'substitute', 'player1_teamB')
+    assert state.player_positions == {
+        'player1_teamA': {'x': -10.0, 'y': 0.0},
+        'substitute': {'x': 30.0, 'y': 30.0},
+        'player1_teamB': {'x': 10.0, 'y': 0.0},
+    }
+    assert state.ball_position == {'x': 0.0, 'y': 0.0}
+
+def test_update_positions_many_players():
+    """Test that a large partial update moves exactly the given players."""
+    players = {f'player{i}': {'x': float(i), 'y': 0.0} for i in range(100)}
+    state = State(initial_player_positions=players)
+    moved = {f'player{i}': {'x': -float(i), 'y': 2.5} for i in range(0, 100, 2)}
+
+    state.update_positions({'x': 1.0, 'y': 1.0}, moved)
+
+    assert state.player_positions == {**players, **moved}
+    with pytest.raises(KeyError):
+        state.update_positions({'x': 1.0, 'y': 1.0}, {f'unknown{i}': {'x': 0.0, 'y': 0.0} for i in range(50)})
+
+
+@pytest.mark.parametrize('n_moved', [2, 60], ids=['per-row', 'scatter'])
+def test_update_positions_unknown_id_leaves_state_unchanged(n_moved):
+    """Test that an update naming an unknown player moves neither the ball nor any player."""
+    players = {f'player{i}': {'x': float(i), 'y': 0.0} for i in range(100)}
+    state = State(initial_ball_pos={'x': 3.0, 'y': 4.0}, initial_player_positions=players)
+    before = state.player_positions
+    moved = {f'player{i}': {'x': -1.0, 'y': -1.0} for i in range(n_moved - 1)}
+    moved['unknown'] = {'x': 0.0, 'y': 0.0}
+
+    with pytest.raises(KeyError):
+        state.update_positions({'x': 9.0, 'y': 9.0}, moved)
+
+    assert state.ball_position == {'x': 3.0, 'y': 4.0}
+    assert state.player_positions is before
+    assert state.player_positions == players
+
+
+def test_player_positions_view_is_cached_until_players_move():
+    """Test that player_positions is reused between updates and cannot be modified."""
+    state = State(initial_player_positions=INITIAL_PLAYER_POSITIONS.copy())
+    view = state.player_positions
+    assert state.player_positions is view
+    with pytest.raises(TypeError):
+        view['player1_teamA'] = {'x': 0.0, 'y': 0.0}
+    with pytest.raises(TypeError):
+        view['player1_teamA']['x'] = 0.0
+
+    state.update_positions({'x': 1.0, 'y': 1.0}, {'player1_teamA': {'x': -9.0, 'y': 1.0}})
+    assert state.player_positions is not view
+    assert state.player_positions['player1_teamA'] == {'x': -9.0, 'y': 1.0}
+    assert view['player1_teamA'] == INITIAL_PLAYER_POSITIONS['player1_teamA']
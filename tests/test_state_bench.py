@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import numpy as np
+from src.zzocker.state import State
+
+
+def build_state(n):
+    """A State with `n` players spread along the x axis."""
+    return State(initial_player_positions={f'player{i}': {'x': float(i), 'y': 0.0} for i in range(n)})
+
+
+@pytest.mark.benchmark(group="state")
+@pytest.mark.parametrize('n', [4, 64, 1024])
+def test_bench_update_positions_arr(benchmark, n):
+    state = build_state(n)
+    ball = np.array([1.0, 2.0], dtype=np.float32)
+    players = np.ones((n, 2), dtype=np.float32)
+    benchmark(state.update_positions_arr, ball, players)
+
+
+@pytest.mark.benchmark(group="state")
+@pytest.mark.parametrize('n', [4, 64, 1024])
+def test_bench_update_positions(benchmark, n):
+    state = build_state(n)
+    players = {player_id: {'x': 1.0, 'y': 1.0} for player_id in state.player_ids}
+    benchmark(state.update_positions, {'x': 1.0, 'y': 2.0}, players)
+
+
+@pytest.mark.benchmark(group="state")
+@pytest.mark.parametrize('n', [4, 64, 1024])
+def test_bench_handle_goal(benchmark, n):
+    # A goal resets with one copy of the prebuilt restart layout into the position array
+    state = build_state(n)
+    benchmark(state.handle_goal, 'teamA')
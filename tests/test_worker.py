@@ -0,0 +1,78 @@
+import pytest
+import threading
+
+from src.zzocker import actions
+from src.zzocker import simulation
+from src.zzocker import state
+from src.zzocker.ai import batch_ai
+from src.zzocker.ai.worker import AIWorker
+
+
+def test_ai_worker_plans_once_on_a_snapshot_and_stops():
+    """Tests that one submitted state yields exactly one plan and stop() joins the thread."""
+
+    class RecordingAI(batch_ai.BallSeekerAI):
+        __slots__ = ('seen', 'planned')
+
+        def __init__(self):
+            super().__init__()
+            self.seen = []
+            self.planned = threading.Event()
+
+        def get_actions(self, game_state, team_id, out):
+            self.seen.append(game_state)
+            super().get_actions(game_state, team_id, out)
+            self.planned.set()
+
+    ai = RecordingAI()
+    worker = AIWorker(ai)
+    game_state = simulation.kickoff_game_state(players_per_team=2)
+    out = actions.ActionBatch(4).lanes(0, 2)
+
+    worker.get_actions(game_state, 1, out)
+    assert (out.kinds == actions.NO_ACTION).all() # No plan finished yet
+    assert ai.planned.wait(timeout=5)
+    worker.stop()
+
+    assert not worker._thread.is_alive()
+    assert len(ai.seen) == 1
+    snapshot, = ai.seen
+    assert isinstance(snapshot, state.StateSnapshot)
+    assert not snapshot.positions.flags.writeable
+
+    worker.get_actions(game_state, 1, out)
+    assert (out.kinds == actions.MOVE).all()
+
+
+def test_ai_worker_keeps_plans_per_team():
+    """Tests one worker playing both teams: each team only ever gets its own plan."""
+
+    class RecordingAI(batch_ai.BallSeekerAI):
+        __slots__ = ('teams', 'planned')
+
+        def __init__(self):
+            super().__init__()
+            self.teams = set()
+            self.planned = threading.Event()
+
+        def get_actions(self, game_state, team_id, out):
+            super().get_actions(game_state, team_id, out)
+            self.teams.add(team_id)
+            if len(self.teams) == 2:
+                self.planned.set()
+
+    worker = AIWorker(RecordingAI())
+    game_state = simulation.kickoff_game_state(players_per_team=2)
+    batch = actions.ActionBatch(4)
+    worker.get_actions(game_state, 1, batch.lanes(0, 2))
+    worker.get_actions(game_state, 2, batch.lanes(2, 4))
+    assert worker._ai.planned.wait(timeout=5)
+    worker.stop()
+
+    worker.get_actions(game_state, 1, batch.lanes(0, 2))
+    worker.get_actions(game_state, 2, batch.lanes(2, 4))
+    expected = actions.ActionBatch(4)
+    batch_ai.BallSeekerAI().get_actions_batched(game_state, expected)
+    assert batch.kinds.tolist() == expected.kinds.tolist()
+    assert batch.target_xy.tolist() == expected.target_xy.tolist()
+    assert batch.target_id.tolist() == expected.target_id.tolist()